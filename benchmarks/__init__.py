@@ -0,0 +1 @@
+"""Benchmarks for daikin_brc1h."""
@@ -0,0 +1,236 @@
+"""
+Benchmark daikin_brc1h polling with simulated units.
+
+Drives `unit_get_status_safe`, `await_with_retry` and
+`KadomaDataUpdateCoordinator` with 1-50 simulated units spread over several
+adapters and reports poll latency percentiles, scheduler (lock) wait time,
+staleness and radio traffic.
+
+Usage:
+    python -m benchmarks.bench_coordinator --units 8 --adapters 3 --rounds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import tempfile
+import time
+from logging import getLogger
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.daikin_brc1h import coordinator as coordinator_module
+from custom_components.daikin_brc1h.const import COORDINATOR_UPDATE_INTERVAL
+from custom_components.daikin_brc1h.coordinator import (
+    STATUS_RETRY_POLICY,
+    KadomaDataUpdateCoordinator,
+    unit_get_status_safe,
+)
+from custom_components.daikin_brc1h.retry import GiveUpError, await_with_retry
+from custom_components.daikin_brc1h.scheduler import UnitScheduler
+
+from .fake_kadoma import FakeConnection, SimulationParams
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+LOGGER = getLogger(__name__)
+
+
+def format_stats(name: str, values: list[float], unit: str = "s") -> str:
+    """Format p50/p90/p99/max of a list of values."""
+    if not values:
+        return f"{name:<24} (no samples)"
+
+    if len(values) == 1:
+        p50 = p90 = p99 = values[0]
+    else:
+        q = statistics.quantiles(values, n=100, method="inclusive")
+        p50, p90, p99 = q[49], q[89], q[98]
+
+    return (
+        f"{name:<24} n={len(values):<5}"
+        f" p50={p50:8.3f}{unit} p90={p90:8.3f}{unit}"
+        f" p99={p99:8.3f}{unit} max={max(values):8.3f}{unit}"
+    )
+
+
+class TimedScheduler(UnitScheduler):
+    """Scheduler recording the time spent waiting for a slot."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        self.waits: list[float] = []
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, address: str, *, time_slice: float | None = None
+    ) -> AsyncIterator[None]:
+        """Run a block of operations against a unit."""
+        t0 = time.monotonic()
+        async with super().slot(address, time_slice=time_slice):
+            self.waits.append(time.monotonic() - t0)
+            yield
+
+
+async def bench_status(args: argparse.Namespace, params: SimulationParams) -> None:
+    """Benchmark a full status read, unit vs adaptive delay."""
+    print("== unit_get_status_safe")  # noqa: T201
+    for calibrated in (False, True):
+        conn = FakeConnection("00:00:00:00:00:00", params)
+        unit = await conn.async_connect()
+
+        durations = []
+        for _ in range(args.rounds):
+            t0 = time.monotonic()
+            with contextlib.suppress(coordinator_module.UnitNotAvailableError):
+                await unit_get_status_safe(
+                    unit, delay=conn.delay if calibrated else None
+                )
+            durations.append(time.monotonic() - t0)
+
+        mode = "adaptive delay" if calibrated else "unit delay"
+        print(format_stats(mode, durations))  # noqa: T201
+
+
+async def bench_retry(args: argparse.Namespace, params: SimulationParams) -> None:
+    """Benchmark await_with_retry, fixed retries vs STATUS_RETRY_POLICY."""
+    print("== await_with_retry")  # noqa: T201
+    for name, kwargs in (
+        ("fixed", {"retries": 3}),
+        ("policy", {"retries": None, "policy": STATUS_RETRY_POLICY}),
+    ):
+        durations = []
+        give_ups = 0
+        for idx in range(args.rounds):
+            conn = FakeConnection(f"00:00:00:00:00:{idx:02X}", params)
+            await conn.async_connect()
+
+            async def get_status(conn: FakeConnection = conn) -> dict:
+                unit = await conn.async_ensure_connected()
+                return await unit_get_status_safe(unit)
+
+            t0 = time.monotonic()
+            try:
+                await await_with_retry(
+                    get_status,
+                    catch_exceptions=coordinator_module.STATUS_CATCH_EXCEPTIONS,
+                    recover=conn.async_recover,
+                    **kwargs,
+                )
+            except GiveUpError:
+                give_ups += 1
+            durations.append(time.monotonic() - t0)
+
+        print(f"{format_stats(name, durations)} give-ups={give_ups}")  # noqa: T201
+
+
+async def bench_coordinators(
+    args: argparse.Namespace, params: SimulationParams
+) -> None:
+    """Benchmark a fleet of coordinators sharing the scheduler."""
+    print(  # noqa: T201
+        f"== KadomaDataUpdateCoordinator ({args.units} units,"
+        f" {args.adapters} adapters, concurrency {args.concurrency})"
+    )
+
+    hass = HomeAssistant(tempfile.mkdtemp())
+    scheduler = TimedScheduler(concurrency=args.concurrency)
+
+    sources = {}
+    coordinators = []
+    for idx in range(args.units):
+        address = f"AA:BB:CC:DD:EE:{idx:02X}"
+        sources[address] = f"adapter-{idx % args.adapters}"
+        scheduler.register(address, sources[address])
+
+        conn = FakeConnection(address, params)
+        await conn.async_connect()
+
+        coordinator = KadomaDataUpdateCoordinator(
+            hass=hass,
+            logger=LOGGER,
+            name=address,
+            update_interval=COORDINATOR_UPDATE_INTERVAL,
+            config_entry=None,
+            scheduler=scheduler,
+        )
+        coordinator.config_entry = SimpleNamespace(
+            runtime_data=SimpleNamespace(
+                connection=conn, commands=SimpleNamespace(pending_knobs=set())
+            )
+        )
+        coordinators.append(coordinator)
+
+    # There is no bluetooth integration here, adapters are simulated
+    coordinator_module.hass_get_unit_source = lambda _hass, address: sources[address]
+
+    async def timed_poll(coordinator: KadomaDataUpdateCoordinator) -> float:
+        t0 = time.monotonic()
+        await coordinator._async_update_data()  # noqa: SLF001
+        return time.monotonic() - t0
+
+    latencies: list[float] = []
+    staleness: list[float] = []
+    t0 = time.monotonic()
+    for _ in range(args.rounds):
+        for coordinator in coordinators:
+            age = coordinator.get_knob_age("sensors")
+            if age is not None:
+                staleness.append(age.total_seconds())
+
+        latencies.extend(await asyncio.gather(*(timed_poll(c) for c in coordinators)))
+    elapsed = time.monotonic() - t0
+
+    queries = sum(c.connection.unit.queries for c in coordinators)
+    reconnects = sum(c.connection.reconnects for c in coordinators)
+    delays = [c.connection.delay.value for c in coordinators]
+
+    print(format_stats("poll latency", latencies))  # noqa: T201
+    print(format_stats("scheduler wait", scheduler.waits))  # noqa: T201
+    print(format_stats("staleness", staleness))  # noqa: T201
+    print(format_stats("calibrated delay", delays))  # noqa: T201
+    print(  # noqa: T201
+        f"{'totals':<24} elapsed={elapsed:.3f}s"
+        f" queries/poll={queries / (args.units * args.rounds):.2f}"
+        f" reconnects={reconnects}"
+    )
+
+    await hass.async_stop(force=True)
+
+
+async def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--units", type=int, default=8)
+    parser.add_argument("--adapters", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--delay", type=float, default=0.2)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    parser.add_argument("--connect-time", type=float, default=1.0)
+    args = parser.parse_args()
+
+    params = SimulationParams(
+        latency=args.latency,
+        delay=args.delay,
+        failure_rate=args.failure_rate,
+        disconnect_rate=args.disconnect_rate,
+        connect_time=args.connect_time,
+    )
+
+    await bench_status(args, params)
+    await bench_retry(args, params)
+    await bench_coordinators(args, params)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,223 @@
+"""
+Simulated kadoma units for daikin_brc1h benchmarks.
+
+Stand-ins for `kadoma.Unit`, `kadoma.transport.Transport`, the Bluetooth
+client and `UnitConnection` with configurable per-operation latency, failure
+and disconnect rates, so the coordinator can be exercised without a BRC1H.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+
+import bleak.exc
+
+from custom_components.daikin_brc1h.connection import UnitDisconnectedError
+from custom_components.daikin_brc1h.const import (
+    BLUETOOTH_DELAY_FACTOR,
+    BLUETOOTH_DELAY_MAX,
+    BLUETOOTH_DELAY_MIN,
+    BLUETOOTH_DELAY_STEP,
+)
+from custom_components.daikin_brc1h.retry import AdaptiveDelay
+
+
+@dataclass
+class SimulationParams:
+    """
+    Behaviour of a simulated unit.
+
+    Attributes:
+        latency: Mean time (in seconds) of a GATT round-trip.
+        latency_jitter: Random variation of each round-trip, as a fraction.
+        delay: Time (in seconds) the unit sleeps between commands (`_delay()`).
+        failure_rate: Probability of a query timing out.
+        disconnect_rate: Probability of the link dropping on a query.
+        connect_time: Time (in seconds) to establish the link.
+        connect_failure_rate: Probability of a connection attempt failing.
+
+    """
+
+    latency: float = 0.05
+    latency_jitter: float = 0.3
+    delay: float = 0.2
+    failure_rate: float = 0.0
+    disconnect_rate: float = 0.0
+    connect_time: float = 1.0
+    connect_failure_rate: float = 0.0
+
+    async def sleep_latency(self) -> None:
+        """Sleep for a GATT round-trip."""
+        jitter = random.uniform(-self.latency_jitter, self.latency_jitter)  # noqa: S311
+        await asyncio.sleep(max(self.latency * (1 + jitter), 0))
+
+    def roll(self, rate: float) -> bool:
+        """Roll the dice."""
+        return random.random() < rate  # noqa: S311
+
+
+class FakeClient:
+    """Bluetooth client stand-in."""
+
+    def __init__(self, address: str) -> None:
+        """Initialize."""
+        self.address = address
+        self.is_connected = True
+
+    async def disconnect(self) -> None:
+        """Drop the link."""
+        self.is_connected = False
+
+
+class FakeTransport:
+    """`kadoma.transport.Transport` stand-in."""
+
+    def __init__(self, client: FakeClient) -> None:
+        """Initialize."""
+        self.client = client
+
+
+class FakeKnob:
+    """Knob stand-in."""
+
+    def __init__(self, unit: FakeUnit, value: object) -> None:
+        """Initialize."""
+        self.unit = unit
+        self.value = value
+        self.queries = 0
+
+    async def _roundtrip(self) -> None:
+        params = self.unit.params
+        if not self.unit.transport.client.is_connected:
+            raise bleak.exc.BleakError("not connected")  # noqa: EM101, TRY003
+
+        await params.sleep_latency()
+
+        if params.roll(params.disconnect_rate):
+            self.unit.transport.client.is_connected = False
+            raise bleak.exc.BleakError("disconnected")  # noqa: EM101
+
+        if params.roll(params.failure_rate):
+            raise TimeoutError
+
+    async def query(self) -> object:
+        """Query the knob value."""
+        self.queries += 1
+        await self._roundtrip()
+        return self.value
+
+    async def update(self, *args: object, **kwargs: object) -> None:
+        """Update the knob value."""
+        await self._roundtrip()
+        self.value = args[0] if args else kwargs
+
+
+class FakeUnit:
+    """`kadoma.Unit` stand-in."""
+
+    def __init__(self, transport: FakeTransport, params: SimulationParams) -> None:
+        """Initialize."""
+        self.transport = transport
+        self.params = params
+
+        self.clean_filter_indicator = FakeKnob(self, False)  # noqa: FBT003
+        self.fan_speed = FakeKnob(self, ("AUTO", "AUTO"))
+        self.operation_mode = FakeKnob(self, "COOL")
+        self.power_state = FakeKnob(self, True)  # noqa: FBT003
+        self.sensors = FakeKnob(self, {"indoor_temperature": 24})
+        self.set_point = FakeKnob(
+            self, {"cooling_set_point": 24, "heating_set_point": 24}
+        )
+
+    @property
+    def queries(self) -> int:
+        """Total number of queries sent to the unit."""
+        return sum(
+            knob.queries for knob in vars(self).values() if isinstance(knob, FakeKnob)
+        )
+
+    async def _delay(self) -> None:
+        await asyncio.sleep(self.params.delay)
+
+    async def start(self) -> None:
+        """Start the unit session."""
+        await self.params.sleep_latency()
+
+    async def stop(self) -> None:
+        """Stop the unit session."""
+        await self.params.sleep_latency()
+
+
+class FakeConnection:
+    """`UnitConnection` stand-in."""
+
+    def __init__(self, address: str, params: SimulationParams) -> None:
+        """Initialize."""
+        self.address = address
+        self.name = address
+        self.params = params
+        self.unit: FakeUnit | None = None
+        self.reconnects = 0
+        self.failures = 0
+        self.connected_since: float | None = None
+        self.last_error: Exception | None = None
+        self.delay = AdaptiveDelay(
+            params.delay,
+            minimum=BLUETOOTH_DELAY_MIN,
+            maximum=BLUETOOTH_DELAY_MAX,
+            step=BLUETOOTH_DELAY_STEP,
+            factor=BLUETOOTH_DELAY_FACTOR,
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the link is up."""
+        return self.unit is not None and self.unit.transport.client.is_connected
+
+    @property
+    def uptime(self) -> float | None:
+        """Time since the link was established."""
+        if not self.is_connected or self.connected_since is None:
+            return None
+
+        return time.monotonic() - self.connected_since
+
+    async def async_connect(self) -> FakeUnit:
+        """Establish the link."""
+        await asyncio.sleep(self.params.connect_time)
+        if self.params.roll(self.params.connect_failure_rate):
+            self.failures += 1
+            msg = f"{self.address}: connection failed"
+            raise UnitDisconnectedError(msg)
+
+        transport = FakeTransport(FakeClient(self.address))
+        queries = self.unit.queries if self.unit is not None else 0
+        self.unit = FakeUnit(transport, self.params)
+        # Keep query count across reconnections
+        self.unit.sensors.queries += queries
+        self.connected_since = time.monotonic()
+        return self.unit
+
+    async def async_ensure_connected(self) -> FakeUnit:
+        """Get the unit, reconnecting if needed."""
+        if self.is_connected:
+            return self.unit
+
+        self.reconnects += 1
+        return await self.async_connect()
+
+    async def async_recover(self) -> None:
+        """Recover the unit."""
+        if self.is_connected:
+            await self.unit.stop()
+            await self.unit.start()
+        else:
+            await self.async_ensure_connected()
+
+    async def async_disconnect(self) -> None:
+        """Drop the link."""
+        if self.unit is not None:
+            await self.unit.transport.client.disconnect()
@@ -10,24 +10,48 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING
 
+import bleak.exc
 from homeassistant.const import CONF_ADDRESS, Platform
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
 from homeassistant.loader import async_get_loaded_integration
 
+from .commands import UnitCommandQueue
+from .config_flow import hass_pop_pending_connection
+from .connection import UnitConnection, UnitDisconnectedError
 from .const import (
+    BLUETOOTH_DELAY_SAVE_DRIFT,
+    CONF_DEVICE_INFO,
     COORDINATOR_UPDATE_INTERVAL,
     DOMAIN,
-    DOMAIN_LOCK_KEY,
+    DOMAIN_SCHEDULER_KEY,
     LOGGER,
+    RECONNECT_BACKOFF_MIN,
 )
-from .coordinator import KadomaDataUpdateCoordinator, hass_get_unit
+from .coordinator import KadomaDataUpdateCoordinator
 from .data import IntegrationKadomaData
+from .entity import get_device_info_fields
+from .scheduler import UnitScheduler, hass_get_unit_source
+from .services import async_setup_services
+from .store import UnitStateStore
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import IntegrationKadomaConfigEntry
 
-PLATFORMS: list[Platform] = [Platform.CLIMATE]
+PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR]
+
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the integration services."""
+    async_setup_services(hass)
+    return True
 
 
 def setup_domain_data(hass: HomeAssistant) -> None:
@@ -35,8 +59,8 @@ def setup_domain_data(hass: HomeAssistant) -> None:
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
-    if DOMAIN_LOCK_KEY not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][DOMAIN_LOCK_KEY] = asyncio.Lock()
+    if DOMAIN_SCHEDULER_KEY not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DOMAIN_SCHEDULER_KEY] = UnitScheduler()
 
 
 async def async_setup_entry(
@@ -46,41 +70,175 @@ async def async_setup_entry(
     """Set up this integration using UI."""
     setup_domain_data(hass)
 
-    unit = await hass_get_unit(hass, entry.data[CONF_ADDRESS], name=entry.title)
+    address = entry.data[CONF_ADDRESS]
+    scheduler = hass.data[DOMAIN][DOMAIN_SCHEDULER_KEY]
+    scheduler.register(address, hass_get_unit_source(hass, address))
+
+    # Reuse the connection validated by the config flow, if any
+    connection = hass_pop_pending_connection(hass, address)
+    if connection is None:
+        connection = UnitConnection(hass, address, name=entry.title)
+    else:
+        connection.name = entry.title
 
     coordinator = KadomaDataUpdateCoordinator(
         hass=hass,
         logger=LOGGER,
         name=DOMAIN,
         update_interval=COORDINATOR_UPDATE_INTERVAL,
-        integration_lock=hass.data[DOMAIN][DOMAIN_LOCK_KEY],
+        scheduler=scheduler,
     )
 
     entry.runtime_data = IntegrationKadomaData(
-        unit=unit,
-        lock=hass.data[DOMAIN][DOMAIN_LOCK_KEY],
+        connection=connection,
+        scheduler=scheduler,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        commands=UnitCommandQueue(hass, coordinator),
+        store=UnitStateStore(hass, address),
     )
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
-
+    # Start from the last known state, the first poll refreshes it
+    if restored := await entry.runtime_data.store.async_load():
+        coordinator.restore_values(*restored)
+        LOGGER.debug(f"{address}: restored {len(restored[0])} knobs")
+
+    if entry.runtime_data.store.delay is not None:
+        connection.delay.restore(entry.runtime_data.store.delay)
+
+    @callback
+    def async_save_state() -> None:
+        entry.runtime_data.store.async_schedule_save(
+            lambda: (coordinator.data or {}, coordinator.knob_updated_at),
+            lambda: connection.delay.value,
+        )
+
+    saved_delay = entry.runtime_data.store.delay
+
+    @callback
+    def async_save_delay() -> None:
+        # The delay is calibrated on every command, polls only save it once it
+        # has drifted (the state itself is saved when the data changes)
+        nonlocal saved_delay
+        if (
+            saved_delay is None
+            or abs(connection.delay.value - saved_delay) >= BLUETOOTH_DELAY_SAVE_DRIFT
+        ):
+            saved_delay = connection.delay.value
+            async_save_state()
+
+    entry.async_on_unload(coordinator.async_add_listener(async_save_state))
+    entry.async_on_unload(coordinator.async_add_poll_listener(async_save_delay))
+
+    # Entities are registered right away (unavailable until the first
+    # successful poll), the unit is connected and polled in the background so
+    # unreachable units don't stall Home Assistant startup.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
+    entry.async_create_background_task(
+        hass,
+        async_start_unit(hass, entry),
+        name=f"{DOMAIN} {address} start",
+    )
+
     return True
 
 
+async def async_start_unit(
+    hass: HomeAssistant,
+    entry: IntegrationKadomaConfigEntry,
+) -> None:
+    """Connect to the unit, with backoff, and run the first refresh."""
+    connection = entry.runtime_data.connection
+    scheduler = entry.runtime_data.scheduler
+
+    # A link can be up without a unit session (i.e. starting it failed)
+    while connection.unit is None or not connection.is_connected:
+        try:
+            async with scheduler.slot(connection.address):
+                await connection.async_ensure_connected()
+
+        except (TimeoutError, UnitDisconnectedError) as e:
+            LOGGER.debug(f"{connection.address}: not connected yet ({e!r})")
+            await asyncio.sleep(max(connection.retry_in, RECONNECT_BACKOFF_MIN))
+
+    # Polls failing while the link was down don't keep the unit unavailable
+    coordinator = entry.runtime_data.coordinator
+    coordinator.breaker.record_success()
+
+    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+    await coordinator.async_refresh()
+
+    if CONF_DEVICE_INFO not in entry.data:
+        await async_update_device_info(hass, entry)
+
+
+async def async_update_device_info(
+    hass: HomeAssistant,
+    entry: IntegrationKadomaConfigEntry,
+) -> None:
+    """
+    Fill the device registry for entries created before device info was cached.
+
+    The device registry persists the info, so it's only fetched while the
+    registry lacks it. The config entry is not updated (that would reload it).
+    """
+    device_registry = dr.async_get(hass)
+    identifiers = {(DOMAIN, entry.entry_id)}
+    device = device_registry.async_get_device(identifiers=identifiers)
+    if device is None or device.model or device.sw_version:
+        return
+
+    connection = entry.runtime_data.connection
+    try:
+        async with entry.runtime_data.scheduler.slot(connection.address):
+            unit = await connection.async_ensure_connected()
+            info = await unit.get_info()
+
+    except (TimeoutError, bleak.exc.BleakError, UnitDisconnectedError) as e:
+        LOGGER.debug(f"{connection.address}: unable to get device info ({e!r})")
+        return
+
+    connection.info = info
+
+    # The device may have been removed while the unit was queried
+    device = device_registry.async_get_device(identifiers=identifiers)
+    if device is not None:
+        device_registry.async_update_device(
+            device.id,
+            **get_device_info_fields(info.get("Device Information", {})),
+        )
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: IntegrationKadomaConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    await entry.runtime_data.unit.stop()
+    await entry.runtime_data.commands.async_shutdown()
+    await entry.runtime_data.coordinator.async_shutdown()
+    await entry.runtime_data.connection.async_disconnect()
+
+    # Write the pending state now, it must not be written after a removal
+    coordinator = entry.runtime_data.coordinator
+    await entry.runtime_data.store.async_save(
+        coordinator.data or {},
+        coordinator.knob_updated_at,
+        entry.runtime_data.connection.delay.value,
+    )
+    entry.runtime_data.scheduler.unregister(entry.data[CONF_ADDRESS])
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: IntegrationKadomaConfigEntry,
+) -> None:
+    """Remove the persisted state of a deleted entry."""
+    await UnitStateStore(hass, entry.data[CONF_ADDRESS]).async_remove()
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: IntegrationKadomaConfigEntry,
@@ -0,0 +1,286 @@
+"""Command queue for daikin_brc1h."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+import bleak.exc
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from .connection import UnitDisconnectedError
+from .const import COMMAND_DEBOUNCE_DELAY
+from .coordinator import UnitNotAvailableError, unit_get_status_safe
+from .state import FAN_MODE_TO_FAN_SPEED, HVAC_MODE_TO_OPERATION_MODE
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from kadoma import Unit
+
+    from .coordinator import KadomaDataUpdateCoordinator
+    from .state import UnitState
+
+LOGGER = getLogger(__name__)
+
+# Writes are sent in this order, i.e. power the unit on before changing its mode
+COMMAND_KNOBS = ("power_state", "operation_mode", "set_point", "fan_speed")
+
+
+async def unit_write_knob(unit: Unit, knob: str, value: Any) -> None:
+    """Write a knob value, as stored in coordinator data, to the unit."""
+    if knob == "power_state":
+        await unit.power_state.update(state=value)
+
+    elif knob == "operation_mode":
+        await unit.operation_mode.update(value)
+
+    elif knob == "set_point":
+        await unit.set_point.update(
+            cooling=value["cooling_set_point"], heating=value["heating_set_point"]
+        )
+
+    elif knob == "fan_speed":
+        cooling, heating = value
+        await unit.fan_speed.update(cooling=cooling, heating=heating)
+
+    else:
+        raise ValueError(knob)
+
+
+def get_command_values(
+    state: UnitState | None,
+    *,
+    hvac_mode: HVACMode | None = None,
+    temperature: float | None = None,
+    fan_mode: str | None = None,
+) -> dict[str, Any]:
+    """
+    Get the knob values to apply Home Assistant climate settings to a unit.
+
+    Args:
+        state: The current state of the unit, used to keep the set points not
+               being changed.
+        hvac_mode: HVAC mode, `HVACMode.OFF` powers the unit off.
+        temperature: Target temperature, for both cooling and heating.
+        fan_mode: Fan mode, for both cooling and heating.
+
+    Raises:
+        ValueError: If the HVAC mode or fan mode is not supported.
+
+    """
+    values: dict[str, Any] = {}
+
+    if hvac_mode == HVACMode.OFF:
+        values["power_state"] = False
+
+    elif hvac_mode is not None:
+        if hvac_mode not in HVAC_MODE_TO_OPERATION_MODE:
+            msg = f"unsupported HVAC mode '{hvac_mode}'"
+            raise ValueError(msg)
+
+        values["power_state"] = True
+        values["operation_mode"] = HVAC_MODE_TO_OPERATION_MODE[hvac_mode]
+
+    if temperature is not None:
+        temperature = round(temperature)
+        set_point = dict((state.set_point if state else None) or {})
+        set_point.update(
+            {"cooling_set_point": temperature, "heating_set_point": temperature}
+        )
+        values["set_point"] = set_point
+
+    if fan_mode is not None:
+        if fan_mode not in FAN_MODE_TO_FAN_SPEED:
+            msg = f"unsupported fan mode '{fan_mode}'"
+            raise ValueError(msg)
+
+        fan_speed = FAN_MODE_TO_FAN_SPEED[fan_mode]
+        values["fan_speed"] = (fan_speed, fan_speed)
+
+    return values
+
+
+class UnitCommandQueue:
+    """
+    Debounced command queue for a unit.
+
+    Commands are applied to the coordinator data immediately (optimistic state)
+    and collected for `COMMAND_DEBOUNCE_DELAY` seconds. Rapid updates to the
+    same knob are coalesced (last write wins), knobs set back to their
+    original value are dropped and the remaining writes are sent in a single
+    scheduler slot, so they don't race with status polling. Within the same
+    slot, only the written knobs are read back to confirm the unit applied
+    them.
+
+    Flushes run one at a time. Commands queued while a flush is waiting for
+    its slot (or writing) start a new debounce period, they are never left
+    behind until the next command.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: KadomaDataUpdateCoordinator,
+        *,
+        delay: float = COMMAND_DEBOUNCE_DELAY,
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.delay = delay
+        self._pending: dict[str, Any] = {}
+        self._original: dict[str, Any] = {}
+        self._flush_lock = asyncio.Lock()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    @property
+    def pending_knobs(self) -> set[str]:
+        """Get the knobs with queued writes, not sent to the unit yet."""
+        return set(self._pending)
+
+    async def async_enqueue(self, **values: Any) -> None:
+        """Queue knob writes and apply them optimistically."""
+        for knob in values:
+            if knob not in COMMAND_KNOBS:
+                raise ValueError(knob)
+
+            if knob not in self._pending:
+                self._original[knob] = (self.coordinator.data or {}).get(knob)
+
+        self._pending.update(values)
+        self.coordinator.set_knob_values(**values)
+
+        self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Flush in `delay` seconds, unless a flush is already scheduled."""
+        if self._unsub_flush is not None:
+            return
+
+        async def flush(_now: datetime) -> None:
+            self._unsub_flush = None
+            await self.async_flush()
+
+        self._unsub_flush = async_call_later(self.hass, self.delay, flush)
+
+    async def async_flush(self) -> None:
+        """Send all pending writes to the unit."""
+        async with self._flush_lock:
+            await self._async_flush()
+
+    async def _async_flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        original, self._original = self._original, {}
+
+        writes = [
+            (k, pending[k])
+            for k in COMMAND_KNOBS
+            if k in pending and pending[k] != original.get(k)
+        ]
+        if not writes:
+            return
+
+        try:
+            await self._async_write(writes)
+
+        except (TimeoutError, bleak.exc.BleakError, UnitDisconnectedError) as e:
+            LOGGER.warning(
+                f"{self.coordinator.connection.address}: unable to write to unit"
+                f" ({e!r})"
+            )
+            # Optimistic state is wrong, get the real one
+            await self.coordinator.async_request_refresh()
+
+    async def async_write(self, **values: Any) -> None:
+        """
+        Write knob values now, bypassing the debounce delay.
+
+        Values are applied optimistically before writing them and queued writes
+        of the same knobs are dropped (these values are newer).
+
+        Raises:
+            TimeoutError: If the unit's scheduler slot is exhausted.
+            bleak.exc.BleakError: If the link fails while writing.
+            UnitDisconnectedError: If the unit can't be connected.
+
+        """
+        for knob in values:
+            if knob not in COMMAND_KNOBS:
+                raise ValueError(knob)
+
+            self._pending.pop(knob, None)
+            self._original.pop(knob, None)
+
+        self.coordinator.set_knob_values(**values)
+
+        try:
+            await self._async_write(
+                [(k, values[k]) for k in COMMAND_KNOBS if k in values]
+            )
+        except (TimeoutError, bleak.exc.BleakError, UnitDisconnectedError):
+            await self.coordinator.async_request_refresh()
+            raise
+
+    async def _async_write(self, writes: list[tuple[str, Any]]) -> None:
+        """Write knob values, in order, and read them back in a single slot."""
+        connection = self.coordinator.connection
+        addr = connection.address
+        LOGGER.debug(f"{addr}: writing {', '.join(k for k, _ in writes)}")
+
+        readback: dict[str, Any] = {}
+        async with self.coordinator.scheduler.slot(addr):
+            unit = await connection.async_ensure_connected()
+            for idx, (knob, value) in enumerate(writes):
+                if idx:
+                    await connection.delay.sleep()
+
+                try:
+                    await unit_write_knob(unit, knob, value)
+                except (TimeoutError, bleak.exc.BleakError):
+                    connection.delay.record_failure()
+                    raise
+
+                connection.delay.record_success()
+
+            await connection.delay.sleep()
+            with contextlib.suppress(UnitNotAvailableError):
+                readback = await unit_get_status_safe(
+                    unit, [k for k, _ in writes], delay=connection.delay
+                )
+
+        self._reconcile(writes, readback)
+
+    def _reconcile(
+        self, writes: list[tuple[str, Any]], readback: dict[str, Any]
+    ) -> None:
+        """Replace the optimistic state with the values read back from the unit."""
+        addr = self.coordinator.connection.address
+        readback = {k: v for k, v in readback.items() if v is not None}
+
+        for knob, value in writes:
+            if knob not in readback:
+                LOGGER.debug(f"{addr}: unable to read back '{knob}'")
+            elif readback[knob] != value:
+                LOGGER.warning(
+                    f"{addr}: '{knob}' is {readback[knob]!r} after writing {value!r}"
+                )
+
+        # Values written meanwhile are pending, keep their optimistic state
+        readback = {k: v for k, v in readback.items() if k not in self._pending}
+        if readback:
+            self.coordinator.set_knob_values(**readback)
+
+    async def async_shutdown(self) -> None:
+        """Drop pending writes and stop the queue."""
+        self._pending = {}
+        self._original = {}
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
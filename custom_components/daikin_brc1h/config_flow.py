@@ -2,16 +2,51 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import bleak.exc
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.components import bluetooth
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 from slugify import slugify
 
-from .const import BLUETOOTH_DISCOVERY_TIMEOUT, DOMAIN, LOGGER, REPOSITORY_URL
-from .coordinator import hass_get_unit
+from .connection import UnitConnection, UnitDisconnectedError
+from .const import (
+    BLUETOOTH_DISCOVERY_TIMEOUT,
+    CONF_DEVICE_INFO,
+    CONF_TEMPERATURE_DEADBAND,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DOMAIN,
+    DOMAIN_PENDING_CONNECTIONS_KEY,
+    LOGGER,
+    REPOSITORY_URL,
+    SERVICE_UUID,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+    from homeassistant.core import HomeAssistant
+
+
+def unit_title(address: str) -> str:
+    """Get the config entry title for a unit."""
+    return f"BRC1H {address[-8:]}"
+
+
+def unit_unique_id(address: str) -> str:
+    """Get the config entry unique ID for a unit."""
+    return slugify(unit_title(address))
+
+
+def hass_pop_pending_connection(
+    hass: HomeAssistant, address: str
+) -> UnitConnection | None:
+    """Take the connection validated by a config flow for a unit, if any."""
+    pending = hass.data.get(DOMAIN, {}).get(DOMAIN_PENDING_CONNECTIONS_KEY, {})
+    return pending.pop(address, None)
 
 
 class KadomaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
@@ -19,6 +54,157 @@ class KadomaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type: igno
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> KadomaOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return KadomaOptionsFlowHandler()
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovery_info: BluetoothServiceInfoBleak | None = None
+        self._connection: UnitConnection | None = None
+
+    async def _async_validate_unit(self, address: str) -> dict[str, str]:
+        """
+        Connect to the unit, returning the errors found (if any).
+
+        The connection is kept open to be handed over to the config entry setup
+        (see `_async_create_unit_entry`) instead of connecting twice.
+        """
+        await self._async_close_connection()
+        connection = UnitConnection(self.hass, address)
+
+        try:
+            unit = await connection.async_connect()
+            info = await unit.get_info()
+            # {'Device Information': {'Firmware Revision String': 'BL C0',
+            #                         'Hardware Revision String': 'UEIS-15288',
+            #                         'IEEE 11073-20601 Regulatory Cert. Data List': '3\x00\x00\x00\x00\x00',
+            #                         'Manufacturer Name String': 'Universal Electronics, '
+            #                                                     'Inc.',
+            #                         'Model Number String': '0.1',
+            #                         'PnP ID': '02:e7:06:31:70:10:01',
+            #                         'Serial Number String': '1.2.3.4.5.6',
+            #                         'Software Revision String': '7031.05.17',
+            #                         'System ID': 'f4:93:1c:ff:fe:97:84:a5'},
+            #  'Generic Access Profile': {'Appearance': '\x00\x00',
+            #                             'Central Address Resolution': '\x00',
+            #                             'Device Name': 'UE878 RF MODULE'},
+            #  'Generic Attribute Profile': {},
+            #  'Unknown': {}}
+
+            # 2026-06-23 14:18:16.916 INFO (MainThread) [custom_components.daikin_brc1h] Successfully connected to 'F4:93:1C:97:84:A5': {'Generic Access Profile': {'Device Name': 'UE878 RF MODULE', 'Appearance': '\x00\x00', 'Central Address Resolution': '\x00'}, 'Unknown': {}, 'Generic Attribute Profile': {}, 'Device Information': {'Software Revision String': '7031.05.17', 'System ID': 'f4:93:1c:ff:fe:97:84:a5', 'Hardware Revision String': 'UEIS-15288', 'Serial Number String': '1.2.3.4.5.6', 'Model Number String': '0.1', 'Firmware Revision String': 'BL C0', 'PnP ID': '02:e7:06:31:70:10:01', 'IEEE 11073-20601 Regulatory Cert. Data List': '3\x00\x00\x00\x00\x00', 'Manufacturer Name String': 'Universal Electronics, Inc.'}}
+            LOGGER.info(f"Successfully connected to '{address}': {info!r}")
+
+        except (TimeoutError, bleak.exc.BleakError, UnitDisconnectedError) as e:
+            LOGGER.warning(
+                f"Exception caught: {e.__class__.__module__}.{e.__class__.__name__}"
+            )
+            LOGGER.exception(e)
+            await connection.async_disconnect()
+            # Timeouts have no message
+            return {"generic": str(e) or repr(e)}
+
+        except BaseException:
+            # Don't leak the link on unexpected errors or cancellation
+            await connection.async_disconnect()
+            raise
+
+        connection.info = info
+        self._connection = connection
+        return {}
+
+    async def _async_close_connection(self) -> None:
+        """Close the validated connection, if it was not handed over."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.async_disconnect()
+
+    def _async_create_unit_entry(
+        self, address: str, data: dict
+    ) -> config_entries.ConfigFlowResult:
+        """Create the config entry, handing over the validated connection."""
+        if self._connection is not None:
+            # Cache device info, so it's available without connecting
+            data = {
+                **data,
+                CONF_DEVICE_INFO: (self._connection.info or {}).get(
+                    "Device Information", {}
+                ),
+            }
+
+            pending = self.hass.data.setdefault(DOMAIN, {}).setdefault(
+                DOMAIN_PENDING_CONNECTIONS_KEY, {}
+            )
+            pending[address] = self._connection
+            self._connection = None
+
+        return self.async_create_entry(title=unit_title(address), data=data)
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the validated connection if the flow is aborted."""
+        if self._connection is not None:
+            self.hass.async_create_task(self._async_close_connection())
+
+    def _async_discovered_addresses(self) -> list[str]:
+        """
+        Get the addresses of not configured units seen by Home Assistant.
+
+        Uses the advertisements already collected by the bluetooth integration,
+        filtered by the Kadoma service UUID, so no scanning is needed.
+        """
+        current_ids = self._async_current_ids(include_ignore=False)
+        return sorted(
+            info.address
+            for info in bluetooth.async_discovered_service_info(
+                self.hass, connectable=True
+            )
+            if SERVICE_UUID in info.service_uuids
+            and unit_unique_id(info.address) not in current_ids
+        )
+
+    async def async_step_bluetooth(
+        self, discovery_info: BluetoothServiceInfoBleak
+    ) -> config_entries.ConfigFlowResult:
+        """Handle a unit discovered by the bluetooth integration."""
+        await self.async_set_unique_id(unit_unique_id(discovery_info.address))
+        self._abort_if_unique_id_configured()
+
+        self._discovery_info = discovery_info
+        self.context["title_placeholders"] = {
+            "name": unit_title(discovery_info.address)
+        }
+
+        return await self.async_step_bluetooth_confirm()
+
+    async def async_step_bluetooth_confirm(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Confirm the setup of a discovered unit."""
+        if self._discovery_info is None:
+            return self.async_abort(reason="no_devices_found")
+
+        address = self._discovery_info.address
+        title = unit_title(address)
+        _errors: dict[str, str] = {}
+
+        if user_input is not None:
+            _errors = await self._async_validate_unit(address)
+            if not _errors:
+                return self._async_create_unit_entry(address, {CONF_ADDRESS: address})
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="bluetooth_confirm",
+            description_placeholders={"name": title},
+            errors=_errors,
+        )
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -26,50 +212,21 @@ class KadomaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type: igno
         _errors: dict[str, str] = {}
 
         if user_input is not None:
-            try:
-                unit = await hass_get_unit(self.hass, user_input[CONF_ADDRESS])
-                info = await unit.get_info()
-                title = f"BRC1H {user_input[CONF_ADDRESS][-8:]}"
-                # {'Device Information': {'Firmware Revision String': 'BL C0',
-                #                         'Hardware Revision String': 'UEIS-15288',
-                #                         'IEEE 11073-20601 Regulatory Cert. Data List': '3\x00\x00\x00\x00\x00',
-                #                         'Manufacturer Name String': 'Universal Electronics, '
-                #                                                     'Inc.',
-                #                         'Model Number String': '0.1',
-                #                         'PnP ID': '02:e7:06:31:70:10:01',
-                #                         'Serial Number String': '1.2.3.4.5.6',
-                #                         'Software Revision String': '7031.05.17',
-                #                         'System ID': 'f4:93:1c:ff:fe:97:84:a5'},
-                #  'Generic Access Profile': {'Appearance': '\x00\x00',
-                #                             'Central Address Resolution': '\x00',
-                #                             'Device Name': 'UE878 RF MODULE'},
-                #  'Generic Attribute Profile': {},
-                #  'Unknown': {}}
-
-                # 2026-06-23 14:18:16.916 INFO (MainThread) [custom_components.daikin_brc1h] Successfully connected to 'F4:93:1C:97:84:A5': {'Generic Access Profile': {'Device Name': 'UE878 RF MODULE', 'Appearance': '\x00\x00', 'Central Address Resolution': '\x00'}, 'Unknown': {}, 'Generic Attribute Profile': {}, 'Device Information': {'Software Revision String': '7031.05.17', 'System ID': 'f4:93:1c:ff:fe:97:84:a5', 'Hardware Revision String': 'UEIS-15288', 'Serial Number String': '1.2.3.4.5.6', 'Model Number String': '0.1', 'Firmware Revision String': 'BL C0', 'PnP ID': '02:e7:06:31:70:10:01', 'IEEE 11073-20601 Regulatory Cert. Data List': '3\x00\x00\x00\x00\x00', 'Manufacturer Name String': 'Universal Electronics, Inc.'}}
-                LOGGER.info(
-                    f"Successfully connected to '{user_input[CONF_ADDRESS]}': {info!r}"
-                )
-
-            except bleak.exc.BleakError as e:
-                LOGGER.warning(
-                    f"Exception caught: {e.__class__.__module__}.{e.__class__.__name__}"
-                )
-                LOGGER.exception(e)
-                _errors["generic"] = str(e)
-
-            else:
-                await self.async_set_unique_id(unique_id=slugify(title))
-                self._abort_if_unique_id_configured()
-
-                return self.async_create_entry(
-                    title=title,
-                    data=user_input,
-                )
-
-            opts = [user_input[CONF_ADDRESS]]
+            address = user_input[CONF_ADDRESS]
+            await self.async_set_unique_id(unique_id=unit_unique_id(address))
+            self._abort_if_unique_id_configured()
+
+            _errors = await self._async_validate_unit(address)
+            if not _errors:
+                return self._async_create_unit_entry(address, user_input)
+
+            opts = [address]
 
         else:
+            opts = self._async_discovered_addresses()
+
+        if not opts:
+            # Nothing in the bluetooth cache, fallback to active scanning
             scanner = bluetooth.async_get_scanner(self.hass)
             devices = await scanner.discover(timeout=BLUETOOTH_DISCOVERY_TIMEOUT)
             # opts = ["{} ({})".format(d.name or d.address, d.address) for d in devices]
@@ -90,3 +247,36 @@ class KadomaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type: igno
             description_placeholders={"repository_url": REPOSITORY_URL},
             errors=_errors,
         )
+
+
+class KadomaOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Kadoma."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_TEMPERATURE_DEADBAND,
+                        default=self.config_entry.options.get(
+                            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=5,
+                            step=0.1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="°C",
+                        )
+                    )
+                }
+            ),
+        )
@@ -0,0 +1,240 @@
+"""Bluetooth connection management for daikin_brc1h."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+import bleak.exc
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+from homeassistant.components import bluetooth
+from kadoma import Unit
+from kadoma.transport import Transport
+
+from .const import (
+    BLUETOOTH_DELAY,
+    BLUETOOTH_DELAY_FACTOR,
+    BLUETOOTH_DELAY_MAX,
+    BLUETOOTH_DELAY_MIN,
+    BLUETOOTH_DELAY_STEP,
+    RECONNECT_BACKOFF_MAX,
+    RECONNECT_BACKOFF_MIN,
+    RECOVER_DELAY,
+)
+from .retry import AdaptiveDelay
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+LOGGER = getLogger(__name__)
+
+
+class UnitDisconnectedError(Exception):
+    """Raised when a unit is disconnected and it can't be reconnected (yet)."""
+
+
+class UnitBackingOffError(UnitDisconnectedError):
+    """Raised when a unit is disconnected and its reconnection backoff is on."""
+
+
+class UnitConnection:
+    """
+    Own the Bluetooth client, transport and unit session of a unit.
+
+    The connection is (re)established lazily on the next operation, with
+    exponential backoff between failed attempts, and recovery only rebuilds
+    the layer that failed: a dropped link costs one reconnect while a confused
+    unit session on a healthy link is restarted without reconnecting.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, address: str, *, name: str | None = None
+    ) -> None:
+        """Initialize the connection."""
+        self.hass = hass
+        self.address = address
+        self.name = name or address
+
+        self.client: BleakClientWithServiceCache | None = None
+        self.unit: Unit | None = None
+        # Output of `Unit.get_info()`, if known
+        self.info: dict | None = None
+        # Delay between commands, calibrated for this unit's link
+        self.delay = AdaptiveDelay(
+            BLUETOOTH_DELAY,
+            minimum=BLUETOOTH_DELAY_MIN,
+            maximum=BLUETOOTH_DELAY_MAX,
+            step=BLUETOOTH_DELAY_STEP,
+            factor=BLUETOOTH_DELAY_FACTOR,
+        )
+
+        self.connected_since: float | None = None
+        self.reconnects = 0
+        self.failures = 0
+        self.last_error: Exception | None = None
+        self._next_attempt = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the link with the unit is up."""
+        return self.client is not None and self.client.is_connected
+
+    @property
+    def uptime(self) -> float | None:
+        """Get the time (in seconds) since the link was established."""
+        if not self.is_connected or self.connected_since is None:
+            return None
+
+        return time.monotonic() - self.connected_since
+
+    @property
+    def retry_in(self) -> float:
+        """Get the time (in seconds) until the next reconnection is allowed."""
+        return max(self._next_attempt - time.monotonic(), 0.0)
+
+    async def async_connect(self) -> Unit:
+        """
+        Establish the link with the unit and start a unit session.
+
+        Any previous link and session are dropped first. If the new session
+        can't be started the new link is dropped too, so the connection never
+        exposes a unit bound to a dead client.
+
+        Raises:
+            UnitDisconnectedError: If the unit is not seen by any adapter.
+
+        """
+        await self.async_disconnect()
+
+        device = bluetooth.async_ble_device_from_address(
+            self.hass, self.address, connectable=True
+        )
+        if device is None:
+            msg = f"{self.address}: not found"
+            raise UnitDisconnectedError(msg)
+
+        client = await establish_connection(
+            BleakClientWithServiceCache,
+            device,
+            self.name or device.name or self.address,
+            max_attempts=3,
+        )
+        # 2026-06-23 14:18:15.389 DEBUG (MainThread) [custom_components.daikin_brc1h] F4:93:1C:97:84:A5: got client=<HaBleakClientWithServiceCache, F4:93:1C:97:84:A5, <class 'bleak.backends.bluezdbus.client.BleakClientBlueZDBus'>>
+        LOGGER.debug(f"{self.name}: got client={client!r}")
+
+        try:
+            unit = await self._async_start_session(client)
+        except BaseException:
+            await client.disconnect()
+            raise
+
+        self.client = client
+        self.unit = unit
+        self.connected_since = time.monotonic()
+
+        return unit
+
+    async def _async_start_session(self, client: BleakClientWithServiceCache) -> Unit:
+        """Start transport and unit session over a link."""
+        transport = Transport(client)
+        await transport.start()
+
+        unit = Unit(transport)
+        await unit.start()
+        return unit
+
+    async def async_ensure_connected(self) -> Unit:
+        """
+        Get the unit, reconnecting it if the link was dropped.
+
+        Failed reconnections are retried with exponential backoff, between
+        `RECONNECT_BACKOFF_MIN` and `RECONNECT_BACKOFF_MAX` seconds.
+
+        Raises:
+            UnitBackingOffError: If the unit is disconnected and it's not time
+                                 to try again yet.
+            UnitDisconnectedError: If the reconnection failed.
+
+        """
+        if self.is_connected and self.unit is not None:
+            return self.unit
+
+        async with self._lock:
+            if self.is_connected and self.unit is not None:
+                return self.unit
+
+            wait = self._next_attempt - time.monotonic()
+            if wait > 0:
+                msg = f"{self.address}: disconnected, next attempt in {wait:.0f}s"
+                raise UnitBackingOffError(msg)
+
+            return await self._async_reconnect()
+
+    async def _async_reconnect(self) -> Unit:
+        LOGGER.debug(f"{self.name}: reconnecting")
+        try:
+            unit = await self.async_connect()
+
+        except (TimeoutError, bleak.exc.BleakError, UnitDisconnectedError) as e:
+            self.failures += 1
+            self.last_error = e
+            backoff = min(
+                RECONNECT_BACKOFF_MIN * 2 ** (self.failures - 1), RECONNECT_BACKOFF_MAX
+            )
+            self._next_attempt = time.monotonic() + backoff
+            LOGGER.debug(
+                f"{self.name}: reconnection failed with {e!r}, backoff {backoff}s"
+            )
+            raise UnitDisconnectedError(str(e)) from e
+
+        self.failures = 0
+        self._next_attempt = 0.0
+        self.reconnects += 1
+        return unit
+
+    async def async_recover(self) -> None:
+        """
+        Recover the layer that failed.
+
+        If the link is down the unit is reconnected (subject to backoff, see
+        `async_ensure_connected`). Otherwise the unit session is restarted over
+        the existing link, and only if that fails the link is rebuilt.
+        """
+        if not self.is_connected or self.unit is None:
+            await self.async_ensure_connected()
+            return
+
+        LOGGER.debug(f"{self.name}: restarting unit session")
+        try:
+            await self.unit.stop()
+            await asyncio.sleep(RECOVER_DELAY)
+            if self.is_connected:
+                await self.unit.start()
+                LOGGER.debug(f"{self.name}: unit session restarted")
+                return
+
+        except (TimeoutError, bleak.exc.BleakError) as e:
+            LOGGER.debug(f"{self.name}: unit session restart failed with {e!r}")
+            self.last_error = e
+
+        await self.async_disconnect()
+        await self.async_ensure_connected()
+
+    async def async_disconnect(self) -> None:
+        """Stop the unit session and drop the link."""
+        unit, self.unit = self.unit, None
+        client, self.client = self.client, None
+        self.connected_since = None
+
+        # Stopping the session needs the link, a dropped one is just released
+        if unit is not None and client is not None and client.is_connected:
+            try:
+                await unit.stop()
+            except (TimeoutError, bleak.exc.BleakError) as e:
+                LOGGER.debug(f"{self.name}: error stopping unit ({e!r})")
+
+        if client is not None and client.is_connected:
+            await client.disconnect()
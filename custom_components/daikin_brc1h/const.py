@@ -8,17 +8,84 @@ LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "daikin_brc1h"
 
+CONF_DEVICE_INFO = "device_info"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+
+SERVICE_UUID = "2141e110-213a-11e6-b67b-9e71128cae77"
+
 BLUETOOTH_DISCOVERY_TIMEOUT = 10.0
+# Initial delay (in seconds) between commands, calibrated for each unit
 BLUETOOTH_DELAY = 0.2
+BLUETOOTH_DELAY_MIN = 0.05
+BLUETOOTH_DELAY_MAX = 2.0
+# Delay decrease (in seconds) after each successful command
+BLUETOOTH_DELAY_STEP = 0.01
+# Delay multiplier after each timed out or failed command
+BLUETOOTH_DELAY_FACTOR = 2.0
+# Calibrated delay changes (in seconds) below this are not written to disk
+BLUETOOTH_DELAY_SAVE_DRIFT = 0.05
 MAX_TEMP = 32.0
 MIN_TEMP = 16.0
 TEMP_STEP = 1.0
-DOMAIN_LOCK_KEY = "lock"
-MAX_UNIT_RESET_ATTEMPS = 3
+DOMAIN_SCHEDULER_KEY = "scheduler"
+DOMAIN_PENDING_CONNECTIONS_KEY = "pending_connections"
 RECOVER_DELAY = 3
+# Backoff limits (in seconds) between failed reconnections
+RECONNECT_BACKOFF_MIN = 1.0
+RECONNECT_BACKOFF_MAX = 300.0
+# Simultaneous operations allowed on each Bluetooth adapter or proxy
+DEFAULT_ADAPTER_CONCURRENCY = 1
+# Max time (in seconds) a unit can hold its adapter on each poll or command
+UNIT_TIME_SLICE = 30.0
+# Max poll slot displacement, as a fraction of the slot width
+POLL_JITTER = 0.1
+# Adapter outage detection: units failing on the same adapter within the
+# window (at least ADAPTER_OUTAGE_MIN_UNITS or this ratio of its units)
+ADAPTER_OUTAGE_WINDOW = 120.0
+ADAPTER_OUTAGE_MIN_UNITS = 2
+ADAPTER_OUTAGE_RATIO = 0.5
+# Polling pause (in seconds) of an adapter in outage, doubled on each failed probe
+ADAPTER_OUTAGE_PAUSE = 30.0
+ADAPTER_OUTAGE_PAUSE_MAX = 300.0
+# Time (in seconds) allowed to retry and recover a status query
+STATUS_RETRY_BUDGET = 20.0
+# Suspend polling a unit after N consecutive failed polls, for N seconds
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 600.0
+# Refresh every knob each N polls, knobs not listed are refreshed on every poll
+KNOB_REFRESH_CYCLES = {
+    "clean_filter_indicator": 60,
+    "fan_speed": 5,
+    "operation_mode": 5,
+    "set_point": 5,
+}
+# Extra queries for failed knobs within the same poll
+KNOB_RETRIES = 1
+# Time (in seconds) to collect commands before writing them to the unit
+COMMAND_DEBOUNCE_DELAY = 0.5
+# Temperature changes (in degrees) below this are not written to sensor entities
+DEFAULT_TEMPERATURE_DEADBAND = 0.5
+# Samples kept for each rolling statistic
+STATS_BUFFER_SIZE = 100
+# Version of the persisted unit state (see store.py)
+STATE_STORAGE_VERSION = 1
+# Time (in seconds) to coalesce state changes before writing them to disk
+STATE_SAVE_DELAY = 30
+# Persisted states older than this are not restored
+STATE_RESTORE_MAX_AGE = timedelta(days=1)
 REPOSITORY_URL = "https://github.com/ldotlopez/ha-daikin-brc1h"
 
 if os.environ.get("HA_DAIKIN_BRC1H_DEBUG", "0") == "0":
     COORDINATOR_UPDATE_INTERVAL = timedelta(seconds=60)
 else:
     COORDINATOR_UPDATE_INTERVAL = timedelta(seconds=30)
+
+# Adaptive polling bounds (in seconds), see KadomaDataUpdateCoordinator
+POLL_INTERVAL_MIN = 15.0
+POLL_INTERVAL_MAX = 300.0
+# Time (in seconds) polls run at POLL_INTERVAL_MIN after a command
+POLL_ACTIVE_WINDOW = 120.0
+# Unchanged polls before a powered off unit is considered idle
+POLL_IDLE_POLLS = 3
+# Poll interval multiplier for idle units
+POLL_IDLE_FACTOR = 4
@@ -3,156 +3,200 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import time
+from datetime import datetime, timedelta
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import bleak.exc
-from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from homeassistant.components import bluetooth
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from kadoma import Unit, UnitInfo
-from kadoma.transport import Transport
+from homeassistant.util import dt as dt_util
 
+from .connection import UnitBackingOffError, UnitConnection, UnitDisconnectedError
 from .const import (
-    MAX_UNIT_RESET_ATTEMPS,
-    RECOVER_DELAY,
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    KNOB_REFRESH_CYCLES,
+    KNOB_RETRIES,
+    POLL_ACTIVE_WINDOW,
+    POLL_IDLE_FACTOR,
+    POLL_IDLE_POLLS,
+    POLL_INTERVAL_MAX,
+    POLL_INTERVAL_MIN,
+    STATUS_RETRY_BUDGET,
 )
-from .retry import GiveUpError, await_with_retry
+from .retry import (
+    AdaptiveDelay,
+    CircuitBreaker,
+    GiveUpError,
+    RetryAction,
+    RetryPolicy,
+    await_with_retry,
+)
+from .scheduler import hass_get_unit_source
+from .state import UnitState, get_target_temperature
+from .stats import UnitStats
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Iterable
+
+    from homeassistant.core import CALLBACK_TYPE
+    from kadoma import Unit, UnitInfo
 
     from .data import IntegrationKadomaConfigEntry
+    from .scheduler import UnitScheduler
 
 
 LOGGER = getLogger(__name__)
 
+KNOBS = (
+    "clean_filter_indicator",
+    "fan_speed",
+    "operation_mode",
+    "power_state",
+    "sensors",
+    "set_point",
+)
+
 
 class UnitNotAvailableError(Exception):
     """Raised when a Kadoma unit is not available."""
 
 
-async def hass_get_unit(
-    hass: HomeAssistant, address: str, *, name: str | None = None
-) -> Unit:
-    """Get a Kadoma unit from Home Assistant by its Bluetooth address."""
-    device = bluetooth.async_ble_device_from_address(hass, address, connectable=True)
-    if device is None:
-        raise ValueError(address)
+class UnitTimedOutError(UnitNotAvailableError, TimeoutError):
+    """Raised when all the queried knobs of a Kadoma unit time out."""
 
-    name = name or device.name or address
 
-    client = await establish_connection(
-        BleakClientWithServiceCache,
-        device,
-        name or device.name or address,
-        max_attempts=3,
-    )
-    # 2026-06-23 14:18:15.389 DEBUG (MainThread) [custom_components.daikin_brc1h] F4:93:1C:97:84:A5: got client=<HaBleakClientWithServiceCache, F4:93:1C:97:84:A5, <class 'bleak.backends.bluezdbus.client.BleakClientBlueZDBus'>>
-    LOGGER.debug(f"{name}: got client={client!r}")
-
-    # try:
-    #     await await_with_retry(
-    #         transport.start,
-    #         catch_exceptions=(TimeoutError, bleak.exc.BleakError),
-    #         log_prefix=f"{name}: transport.start ",
-    #     )
-    # except GiveUpError as e:
-    #     LOGGER.error(
-    #         f"{name}: Unable to start unit '{address}': TimeoutError ({e!r})"
-    #     )
-    #     return False
-    transport = Transport(client)
-    await transport.start()
-    # LOGGER.debug(f"{name}: transport ready ({transport!r})")
-
-    unit = Unit(transport)
-    await unit.start()
-    # LOGGER.debug(f"{name}: unit ready ({unit!r})")
-
-    return unit
-
-
-async def unit_get_status_safe(unit: Unit) -> dict:
-    """Safely query the status of a Kadoma unit."""
-    knobs = {
-        "clean_filter_indicator": unit.clean_filter_indicator,
-        "fan_speed": unit.fan_speed,
-        "operation_mode": unit.operation_mode,
-        "power_state": unit.power_state,
-        "sensors": unit.sensors,
-        "set_point": unit.set_point,
-    }
+class UnitLinkError(UnitNotAvailableError, bleak.exc.BleakError):
+    """Raised when a Kadoma unit is not available due to a link error."""
 
-    ret = {}
-    for k, knob in knobs.items():
-        try:
-            value = await knob.query()
-        except Exception as e:
-            LOGGER.exception(
-                f"unknow exception '{e.__class__.__module__}.{e.__class__.__name__}' "
-                f"while querying '{k}'"
-            )
-            value = None
 
-        ret[k] = value
+class AdapterPausedError(Exception):
+    """Raised when polling is paused due to an outage of the unit's adapter."""
 
-        await unit._delay()
 
-    if all(v is None for v in ret.values()):
-        raise UnitNotAvailableError
+STATUS_CATCH_EXCEPTIONS = (
+    asyncio.TimeoutError,
+    bleak.exc.BleakError,
+    UnitDisconnectedError,
+    UnitNotAvailableError,
+)
+STATUS_RETRY_POLICY = RetryPolicy(
+    budget=STATUS_RETRY_BUDGET,
+    strategies=(
+        # Reconnection failed and it's backing off, don't insist
+        (UnitDisconnectedError, RetryAction.GIVE_UP),
+        # Transient RF noise, the link and session are fine (all knobs timing
+        # out surface as `UnitTimedOutError`)
+        (TimeoutError, RetryAction.RETRY),
+        # Dropped links or broken sessions (surfaced as `UnitLinkError`)
+        (bleak.exc.BleakError, RetryAction.RECOVER),
+        # All knobs failing for any other reason
+        (UnitNotAvailableError, RetryAction.RECOVER),
+    ),
+)
 
-    return ret
 
+def get_unit_not_available_error(
+    errors: list[BaseException],
+) -> UnitNotAvailableError:
+    """
+    Get the error to raise when all the queried knobs of a unit failed.
 
-async def unit_recover(unit: Unit) -> None:
+    Link errors take precedence over timeouts, so the link is recovered even
+    if some knobs only timed out.
     """
-    Attempt to recover a unit by stopping and starting it with retries.
+    if any(isinstance(e, bleak.exc.BleakError) for e in errors):
+        return UnitLinkError()
+
+    if errors and all(isinstance(e, TimeoutError) for e in errors):
+        return UnitTimedOutError()
+
+    return UnitNotAvailableError()
 
-    This function tries to re-establish a working connection with the unit
-    by first attempting to stop it (if connected) and then starting it.
-    It performs multiple attempts, logging progress and failures.
+
+async def unit_get_status_safe(
+    unit: Unit,
+    knobs: Iterable[str] | None = None,
+    *,
+    timings: dict[str, float] | None = None,
+    delay: AdaptiveDelay | None = None,
+) -> dict:
+    """
+    Safely query the status of a Kadoma unit.
 
     Args:
-        unit: The `kadoma.Unit` instance to attempt recovery on.
-              It is expected to have `transport.client.address`,
-              `transport.client.is_connected`, `stop()`, and `start()` methods.
+        unit: The `kadoma.Unit` instance to query.
+        knobs: Names of the knobs to query. If `None` all of them are queried.
+        timings: An optional dict to store the time (in seconds) taken by each
+                 knob query.
+        delay: Calibrated delay between queries, it's fed with the outcome of
+               each query. If `None` the unit's fixed delay is used.
 
     Raises:
-        GiveUpError: If all `MAX_UNIT_RESET_ATTEMPS` fail to recover the unit,
-                     or if an unexpected exception occurs during any attempt.
+        UnitLinkError: If all the queried knobs fail, any of them due to a
+                       link error.
+        UnitTimedOutError: If all the queried knobs time out.
+        UnitNotAvailableError: If all the queried knobs fail for any other
+                               reason.
 
     """
-    for attempt in range(MAX_UNIT_RESET_ATTEMPS):
-        addr = unit.transport.client.address
-        step = f"{attempt + 1}/{MAX_UNIT_RESET_ATTEMPS}"
-
-        LOGGER.debug(f"{addr}: Recovering unit #{step}")
+    knobs = {k: getattr(unit, k) for k in (KNOBS if knobs is None else sorted(knobs))}
 
+    async def timed_query(k: str) -> Any:
+        t0 = time.monotonic()
         try:
-            # By-pass any possible configured or unconfigured unit delay
-            if unit.transport.client.is_connected:
-                await unit.stop()
-                await asyncio.sleep(RECOVER_DELAY)
-                LOGGER.debug(f"{addr}: recover #{step} stopped successfully")
-
-            await unit.start()
-            LOGGER.debug(f"{addr}: recover #{step} started successfully")
-            LOGGER.debug(f"{addr}: recover #{step} unit recovered")
+            return await knobs[k].query()
+        finally:
+            if timings is not None:
+                timings[k] = time.monotonic() - t0
+
+    def record(result: Any) -> None:
+        if delay is None:
             return
 
-        except (TimeoutError, bleak.exc.BleakError) as e:
-            LOGGER.debug(f"{addr}: recover #{step} failed with {e!r}")
-            await asyncio.sleep(RECOVER_DELAY)
+        if isinstance(result, (TimeoutError, bleak.exc.BleakError)):
+            delay.record_failure()
+        elif not isinstance(result, BaseException):
+            delay.record_success()
+
+    t0 = time.monotonic()
+    results = []
+    for idx, k in enumerate(knobs):
+        try:
+            results.append(await timed_query(k))
+        except Exception as e:  # noqa: BLE001
+            results.append(e)
+        record(results[-1])
+
+        # No need to wait after the last query
+        if idx + 1 < len(knobs):
+            await (delay.sleep() if delay else unit._delay())  # noqa: SLF001
 
-        except Exception as e:
-            LOGGER.debug(
-                f"{addr}: recover #{step} got unhandled exception"
-                f" {e.__class__.__name__}"
+    ret = {}
+    for k, value in zip(knobs, results, strict=True):
+        if isinstance(value, BaseException):
+            LOGGER.error(
+                f"unknow exception '{value.__class__.__module__}."
+                f"{value.__class__.__name__}' while querying '{k}'",
+                exc_info=value,
             )
-            raise
+            ret[k] = None
+        else:
+            ret[k] = value
 
-    raise GiveUpError
+    LOGGER.debug(
+        f"{unit.transport.client.address}: status read in {time.monotonic() - t0:.3f}s"
+    )
+
+    if all(v is None for v in ret.values()):
+        errors = [v for v in results if isinstance(v, BaseException)]
+        raise get_unit_not_available_error(errors) from (errors[-1] if errors else None)
+
+    return ret
 
 
 class KadomaDataUpdateCoordinator(DataUpdateCoordinator):
@@ -160,48 +204,354 @@ class KadomaDataUpdateCoordinator(DataUpdateCoordinator):
 
     config_entry: IntegrationKadomaConfigEntry
 
-    def __init__(self, *args, integration_lock: asyncio.Lock, **kwargs) -> None:
-        """Initialize the coordinator."""
+    def __init__(self, *args, scheduler: UnitScheduler, **kwargs) -> None:
+        """
+        Initialize the coordinator.
+
+        Listeners are only notified if the data changed (`always_update` is
+        `False`), so polls of an idle unit don't write any state. Use
+        `async_add_poll_listener` to be called after every poll instead.
+        """
+        kwargs.setdefault("always_update", False)
         super().__init__(*args, **kwargs)
-        self.integration_lock = integration_lock
+        self.scheduler = scheduler
+        self.base_update_interval = self.update_interval
+        self.last_poll_duration: float | None = None
+        self._cycle = 0
+        self._values: dict[str, Any] = {}
+        self._failed_knobs: set[str] = set()
+        self.knob_updated_at: dict[str, datetime] = {}
+        self.stats = UnitStats()
+        self._cycle_attempts = 0
+        self._cycle_recoveries = 0
+        self.breaker = CircuitBreaker(
+            CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_COOLDOWN
+        )
+        self.state: UnitState | None = None
+        self._poll_listeners: list[CALLBACK_TYPE] = []
+        self._last_command_at = float("-inf")
+        # When each knob was last set by `set_knob_values` (monotonic)
+        self._knob_set_at: dict[str, float] = {}
+        self._stable_polls = 0
+        self._temperature_moving = False
+
+    @property
+    def connection(self) -> UnitConnection:
+        return self.config_entry.runtime_data.connection
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Take a new state snapshot and update all registered listeners."""
+        self.state = None if self.data is None else UnitState.from_values(self.data)
+        super().async_update_listeners()
+
+    @callback
+    def async_add_poll_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for poll attempts, even if the data didn't change."""
+        self._poll_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._poll_listeners.remove(update_callback)
+
+        return remove_listener
 
     async def _async_update_data(self) -> UnitInfo | None:
-        # TODO:
-        # Add a random delay if there's more than one integration in this domain
-        # to decouple this call from the others.
-        #
-        # if there_is_more_than_one:
-        #     await asyncio.sleep(self.update_interval.total_seconds() * 0.1)
-
-        async with self.integration_lock:
-            addr = self.config_entry.runtime_data.unit.transport.client.address
-            info = None
-            try:
+        try:
+            data = await self._async_update_unit_data()
+            self._track_activity(data)
+            return data
+        finally:
+            self._schedule_next_slot()
+            for update_callback in list(self._poll_listeners):
+                update_callback()
+
+    def _track_activity(self, data: dict | None) -> None:
+        """Track how the unit state evolves between polls."""
+        if data is None:
+            return
+
+        self._stable_polls = self._stable_polls + 1 if data == self.data else 0
+
+        # Only moving toward the set point, drifting away (i.e. the unit can't
+        # keep up) doesn't need closer monitoring
+        prev = ((self.data or {}).get("sensors") or {}).get("indoor_temperature")
+        curr = (data.get("sensors") or {}).get("indoor_temperature")
+        target = get_target_temperature(
+            data.get("operation_mode"), data.get("set_point")
+        )
+        self._temperature_moving = (
+            prev is not None
+            and curr is not None
+            and target is not None
+            and (curr - prev) * (target - prev) > 0
+        )
+
+    def get_poll_interval(self) -> float:
+        """
+        Get the poll interval (in seconds) for the unit activity.
+
+        Polls are fast (`POLL_INTERVAL_MIN`) for `POLL_ACTIVE_WINDOW` seconds
+        after a command and twice as fast as the base interval while the room
+        temperature moves toward the set point. Powered off units whose state
+        didn't change in `POLL_IDLE_POLLS` polls are polled `POLL_IDLE_FACTOR`
+        times slower. The result is bounded to `POLL_INTERVAL_MIN` and
+        `POLL_INTERVAL_MAX` (or the base interval, if larger).
+        """
+        base = self.base_update_interval.total_seconds()
+        state = self.state
+
+        if time.monotonic() - self._last_command_at < POLL_ACTIVE_WINDOW:
+            interval = POLL_INTERVAL_MIN
+
+        elif state is None:
+            interval = base
+
+        elif (
+            state.power_state
+            and self._temperature_moving
+            and state.target_temperature is not None
+            and state.current_temperature != state.target_temperature
+        ):
+            interval = base / 2
+
+        elif state.power_state is False and self._stable_polls >= POLL_IDLE_POLLS:
+            interval = base * POLL_IDLE_FACTOR
+
+        else:
+            interval = base
+
+        return min(max(interval, POLL_INTERVAL_MIN), max(POLL_INTERVAL_MAX, base))
+
+    def _schedule_next_slot(self) -> None:
+        """
+        Move the next refresh to this unit's poll slot.
+
+        Coordinators reschedule themselves `update_interval` after each refresh,
+        so tweaking the interval keeps every unit anchored to its own slot
+        instead of all of them firing (and queueing) at the same time. The
+        slot width follows the unit activity (see `get_poll_interval`).
+        """
+        if self.base_update_interval is None:
+            return
+
+        addr = self.connection.address
+        delay = self.scheduler.next_poll_delay(addr, self.get_poll_interval())
+        self.update_interval = timedelta(seconds=delay)
+        LOGGER.debug(f"{addr}: next poll in {delay:.1f}s")
+
+    async def _async_update_unit_data(self) -> UnitInfo | None:
+        addr = self.connection.address
+
+        if not self.breaker.allow():
+            LOGGER.debug(f"{addr}: polling suspended after repeated failures")
+            return None
+
+        # Units can roam between adapters and proxies, follow them
+        self.scheduler.register(addr, hass_get_unit_source(self.hass, addr))
+
+        if self.scheduler.is_paused(addr):
+            LOGGER.debug(f"{addr}: polling paused, adapter is recovering")
+            return None
+
+        info = None
+        self._cycle_attempts = 0
+        self._cycle_recoveries = 0
+        t0 = time.monotonic()
+        try:
+            async with self.scheduler.slot(addr):
+                self.stats.lock_wait.add(time.monotonic() - t0)
                 info = await await_with_retry(
                     self._get_unit_status_safe,
-                    catch_exceptions=(
-                        asyncio.TimeoutError,
-                        bleak.exc.BleakError,
-                        UnitNotAvailableError,
-                    ),
+                    retries=None,
+                    catch_exceptions=STATUS_CATCH_EXCEPTIONS,
                     recover=self._recover_unit,
                     log_prefix=f"{addr}: get_status() ",
+                    policy=STATUS_RETRY_POLICY,
                 )
-            except GiveUpError:
-                LOGGER.warning(f"{addr}: is not available")
-                return info
 
+        except AdapterPausedError:
+            LOGGER.debug(f"{addr}: polling paused, adapter is recovering")
+            return info
+
+        except GiveUpError as e:
+            self.stats.failed_polls += 1
+            if isinstance(e.__cause__, UnitBackingOffError):
+                # Nothing was sent, waiting to reconnect is not a failure of
+                # the unit (it would keep the breaker open once reconnected)
+                LOGGER.debug(f"{addr}: not connected yet ({e.__cause__})")
             else:
-                # await asyncio.sleep(random.range(0, 30) / 10)
-                return info
+                LOGGER.warning(f"{addr}: is not available")
+                self.breaker.record_failure()
+                self.scheduler.record_failure(addr)
+            return info
+
+        except TimeoutError:
+            LOGGER.warning(
+                f"{addr}: is not available (time slice of"
+                f" {self.scheduler.time_slice}s exhausted)"
+            )
+            self.breaker.record_failure()
+            self.scheduler.record_failure(addr)
+            self.stats.failed_polls += 1
+            return info
+
+        else:
+            self.breaker.record_success()
+            self.scheduler.record_success(addr)
+            return info
+
+        finally:
+            self.stats.polls += 1
+            self.stats.retries.add(max(self._cycle_attempts - 1, 0))
+            self.stats.recoveries.add(self._cycle_recoveries)
+
+    def _get_due_knobs(self) -> list[str]:
+        """Get the knobs that must be refreshed in the current cycle."""
+        return [
+            k
+            for k in KNOBS
+            if self._values.get(k) is None
+            or k in self._failed_knobs
+            or self._cycle % KNOB_REFRESH_CYCLES.get(k, 1) == 0
+        ]
+
+    def _store_values(self, values: dict[str, Any]) -> None:
+        """Keep the good values (not `None`) and when they were received."""
+        now = dt_util.utcnow()
+        for k, v in values.items():
+            if v is None:
+                continue
+
+            self._values[k] = v
+            self.knob_updated_at[k] = now
+
+    def get_knob_age(self, knob: str) -> timedelta | None:
+        """Get the time since the last good value of a knob was received."""
+        if knob not in self.knob_updated_at:
+            return None
+
+        return dt_util.utcnow() - self.knob_updated_at[knob]
 
     async def _get_unit_status_safe(self) -> dict:
-        """Safely query the status of the unit."""
-        return await unit_get_status_safe(self.config_entry.runtime_data.unit)
+        """
+        Safely query the status of the unit.
+
+        Only the knobs due in the current cycle (see `KNOB_REFRESH_CYCLES`) are
+        queried, the rest of them are taken from the previous cycles. Knobs that
+        fail are queried again (up to `KNOB_RETRIES` times) and, if they still
+        fail, their last good value is kept and they are due on the next cycle.
+
+        Values read while a knob is being commanded are stale, knobs with
+        queued writes or set (see `set_knob_values`) after the poll started
+        keep their optimistic value.
+        """
+        self._cycle_attempts += 1
+        timings: dict[str, float] = {}
+
+        # Units waiting for a slot when the adapter outage was detected
+        if self.scheduler.is_paused(self.connection.address):
+            raise AdapterPausedError
+
+        t0 = time.monotonic()
+        try:
+            unit = await self.connection.async_ensure_connected()
+            values = await unit_get_status_safe(
+                unit,
+                self._get_due_knobs(),
+                timings=timings,
+                delay=self.connection.delay,
+            )
+
+            for _ in range(KNOB_RETRIES):
+                failed = [k for k, v in values.items() if v is None]
+                if not failed:
+                    break
+
+                LOGGER.debug(f"{self.connection.address}: retrying {failed}")
+                await self.connection.delay.sleep()
+                with contextlib.suppress(UnitNotAvailableError):
+                    values.update(
+                        await unit_get_status_safe(
+                            unit, failed, timings=timings, delay=self.connection.delay
+                        )
+                    )
+
+        finally:
+            self.last_poll_duration = time.monotonic() - t0
+            self.stats.poll_duration.add(self.last_poll_duration)
+            for k, latency in timings.items():
+                self.stats.knob_latency[k].add(latency)
+
+        held = self.config_entry.runtime_data.commands.pending_knobs | {
+            k for k, set_at in self._knob_set_at.items() if set_at >= t0
+        }
+        if stale := sorted(held & values.keys()):
+            LOGGER.debug(f"{self.connection.address}: keeping optimistic {stale}")
+
+        self._store_values({k: v for k, v in values.items() if k not in held})
+        self._failed_knobs = {k for k, v in values.items() if v is None}
+        self._cycle += 1
+
+        return {k: self._values.get(k) for k in KNOBS}
+
+    def set_knob_values(self, **values: Any) -> None:
+        """
+        Set knob values known in advance (i.e. after a command).
+
+        Cached values are updated too, so knobs not queried on every cycle
+        don't go back in time on the next poll. The unit is considered active,
+        a distant poll is moved to the (faster) active poll slot.
+        """
+        self._last_command_at = time.monotonic()
+        self._knob_set_at.update(dict.fromkeys(values, self._last_command_at))
+        self._store_values(values)
+        if self.data is not None:
+            self.data.update(values)
+        self.async_update_listeners()
+
+        if (
+            self.update_interval is not None
+            and self.update_interval.total_seconds() > 2 * POLL_INTERVAL_MIN
+        ):
+            self._schedule_next_slot()
+            self._schedule_refresh()
+
+    @callback
+    def restore_values(
+        self, values: dict[str, Any], updated_at: dict[str, datetime]
+    ) -> None:
+        """
+        Use a persisted state until the first poll.
+
+        Values keep their original timestamps (see `get_knob_age`) and the
+        listeners are not notified, entities pick the data up when added.
+        """
+        for k in KNOBS:
+            if values.get(k) is None:
+                continue
+
+            self._values[k] = values[k]
+            self.knob_updated_at[k] = updated_at[k]
+
+        self.data = {k: self._values.get(k) for k in KNOBS}
+        self.state = UnitState.from_values(self.data)
 
     async def _recover_unit(self) -> None:
-        """Recover the unit."""
-        await unit_recover(self.config_entry.runtime_data.unit)
+        """Recover the unit, unless its adapter is recovering itself."""
+        if self.scheduler.is_paused(self.connection.address):
+            raise AdapterPausedError
+
+        self._cycle_recoveries += 1
+        await self.connection.async_recover()
+
+    @property
+    def rssi(self) -> int | None:
+        """Get the signal strength of the last advertisement seen."""
+        service_info = bluetooth.async_last_service_info(
+            self.hass, self.connection.address, connectable=True
+        )
+        return service_info.rssi if service_info else None
 
 
 # async def _async_update_data(self) -> kadoma.UnitInfo:
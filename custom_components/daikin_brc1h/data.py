@@ -6,13 +6,15 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    import asyncio
-
     import kadoma
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
+    from .commands import UnitCommandQueue
+    from .connection import UnitConnection
     from .coordinator import KadomaDataUpdateCoordinator
+    from .scheduler import UnitScheduler
+    from .store import UnitStateStore
 
 
 type IntegrationKadomaConfigEntry = ConfigEntry[IntegrationKadomaData]
@@ -22,7 +24,14 @@ type IntegrationKadomaConfigEntry = ConfigEntry[IntegrationKadomaData]
 class IntegrationKadomaData:
     """Data for the Kadoma integration."""
 
-    unit: kadoma.Unit
-    lock: asyncio.Lock
+    connection: UnitConnection
+    scheduler: UnitScheduler
     coordinator: KadomaDataUpdateCoordinator
     integration: Integration
+    commands: UnitCommandQueue
+    store: UnitStateStore
+
+    @property
+    def unit(self) -> kadoma.Unit | None:
+        """Current unit session, `None` while disconnected."""
+        return self.connection.unit
@@ -0,0 +1,65 @@
+"""Diagnostics support for daikin_brc1h."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.const import CONF_ADDRESS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import IntegrationKadomaConfigEntry
+
+# Unit and adapter identifiers (Bluetooth addresses, entry titles derived from
+# them and the 'Device Information' of the unit)
+TO_REDACT = {
+    CONF_ADDRESS,
+    "adapter",
+    "title",
+    "Serial Number String",
+    "System ID",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: IntegrationKadomaConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    connection = entry.runtime_data.connection
+    address = connection.address
+
+    return async_redact_data(
+        {
+            "entry": {
+                "title": entry.title,
+                "data": dict(entry.data),
+            },
+            "connection": {
+                "address": address,
+                "adapter": coordinator.scheduler.source_for(address),
+                "is_connected": connection.is_connected,
+                "uptime": connection.uptime,
+                "reconnects": connection.reconnects,
+                "failures": connection.failures,
+                # Errors may mention the unit address
+                "last_error": repr(connection.last_error).replace(address, REDACTED),
+                "delay": connection.delay.value,
+                "rssi": coordinator.rssi,
+            },
+            "coordinator": {
+                "update_interval": str(coordinator.update_interval),
+                "last_update_success": coordinator.last_update_success,
+                "circuit_breaker_open": coordinator.breaker.is_open,
+                "data": {k: repr(v) for k, v in (coordinator.data or {}).items()},
+                "knob_updated_at": {
+                    k: v.isoformat() for k, v in coordinator.knob_updated_at.items()
+                },
+            },
+            "stats": coordinator.stats.as_dict(),
+        },
+        TO_REDACT,
+    )
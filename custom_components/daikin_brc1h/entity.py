@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from typing import Any
+
+from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .const import CONF_DEVICE_INFO
 from .coordinator import KadomaDataUpdateCoordinator
 
+# Device registry fields from the 'Device Information' GATT service
+DEVICE_INFO_FIELDS = {
+    "manufacturer": "Manufacturer Name String",
+    "model": "Model Number String",
+    "hw_version": "Hardware Revision String",
+    "sw_version": "Software Revision String",
+    "serial_number": "Serial Number String",
+}
+
+
+def get_device_info_fields(device_information: dict[str, str]) -> dict[str, Any]:
+    """Map the 'Device Information' of `Unit.get_info()` to device registry fields."""
+    return {
+        k: device_information[v]
+        for k, v in DEVICE_INFO_FIELDS.items()
+        if device_information.get(v)
+    }
+
 
 class IntegrationKadomaEntity(CoordinatorEntity[KadomaDataUpdateCoordinator]):
     """KadomaEntity class."""
@@ -22,4 +43,8 @@ class IntegrationKadomaEntity(CoordinatorEntity[KadomaDataUpdateCoordinator]):
                     coordinator.config_entry.entry_id,
                 ),
             },
+            connections={(CONNECTION_BLUETOOTH, coordinator.connection.address)},
+            **get_device_info_fields(
+                coordinator.config_entry.data.get(CONF_DEVICE_INFO, {})
+            ),
         )
@@ -18,8 +18,12 @@
 # USA.
 
 import asyncio
+import enum
 import logging
+import random
+import time
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import TypeVar
 
 LOGGER = logging.getLogger(__name__)
@@ -30,14 +34,146 @@ DEFAULT_RETRIES = 3
 T = TypeVar("T")
 
 
-async def await_with_retry[T](
+class RetryAction(enum.Enum):
+    """What to do after a failed attempt."""
+
+    RETRY = enum.auto()
+    RECOVER = enum.auto()
+    GIVE_UP = enum.auto()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry policy for `await_with_retry`.
+
+    Attributes:
+        base_delay: Delay (in seconds) after the first failed attempt.
+        max_delay: Upper limit for the delay between attempts.
+        multiplier: Growth factor of the delay after each failed attempt.
+        jitter: Random variation of each delay, as a fraction of it.
+        budget: Time (in seconds) allowed for all the attempts, recoveries and
+                delays. If `None` only the number of retries is limited.
+        strategies: Pairs of exception type and the `RetryAction` to take when
+                    an attempt fails with it. The first matching pair wins and
+                    exceptions without a matching pair are recovered from.
+
+    """
+
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+    budget: float | None = None
+    strategies: tuple[tuple[type[Exception], RetryAction], ...] = ()
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the delay (in seconds) after the failed attempt number `attempt`."""
+        delay = min(self.base_delay * self.multiplier**attempt, self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)  # noqa: S311
+
+    def get_action(self, error: Exception) -> RetryAction:
+        """Get the action to take after an attempt failed with `error`."""
+        for exc_type, action in self.strategies:
+            if isinstance(error, exc_type):
+                return action
+
+        return RetryAction.RECOVER
+
+
+class AdaptiveDelay:
+    """
+    Self-calibrating delay between commands (AIMD).
+
+    Each success shortens the delay by `step` seconds (additive increase of
+    the command rate) and each failure multiplies it by `factor`
+    (multiplicative decrease), always within `minimum` and `maximum`. The
+    delay converges to the fastest pace the link sustains reliably.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        *,
+        minimum: float,
+        maximum: float,
+        step: float,
+        factor: float,
+    ) -> None:
+        """Initialize the delay."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.step = step
+        self.factor = factor
+        self.value = min(max(initial, minimum), maximum)
+
+    def restore(self, value: float) -> None:
+        """Set the delay (i.e. a previously calibrated one), within bounds."""
+        self.value = min(max(value, self.minimum), self.maximum)
+
+    async def sleep(self) -> None:
+        """Wait between commands."""
+        await asyncio.sleep(self.value)
+
+    def record_success(self) -> None:
+        """Shorten the delay."""
+        self.value = max(self.value - self.step, self.minimum)
+
+    def record_failure(self) -> None:
+        """Lengthen the delay."""
+        self.value = min(self.value * self.factor, self.maximum)
+
+
+class CircuitBreaker:
+    """
+    Stop calling an operation that keeps failing.
+
+    After `threshold` consecutive failures the breaker opens and `allow()`
+    returns `False` for `cooldown` seconds. Then a single trial is allowed
+    (half-open): a success closes the breaker, a failure opens it again.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        """Initialize the breaker."""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Check if calls are being suspended."""
+        return (
+            self.opened_at is not None
+            and time.monotonic() - self.opened_at < self.cooldown
+        )
+
+    def allow(self) -> bool:
+        """Check if the operation can be called now."""
+        return not self.is_open
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failure, opening the breaker if the threshold is reached."""
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+async def await_with_retry[T](  # noqa: PLR0912
     awaitable: Callable[[], Awaitable[T]],
-    retries: int = DEFAULT_RETRIES,
+    retries: int | None = DEFAULT_RETRIES,
     delay: float | None = None,
     catch_exceptions: type[Exception] | tuple[type[Exception], ...] | None = None,
     recover: Callable[[], Awaitable[None]] | None = None,
     operation_name: str | None = None,
     log_prefix: str = "",
+    *,
+    policy: RetryPolicy | None = None,
 ) -> T:
     """
     Awaits a callable with a retry mechanism and optional recovery.
@@ -52,9 +188,11 @@ async def await_with_retry[T](
                    an awaitable, e.g., a coroutine). This is the operation
                    that will be retried.
         retries: The maximum number of attempts to make, including the initial
-                 one. Defaults to `DEFAULT_RETRIES`.
+                 one. Defaults to `DEFAULT_RETRIES`. It can be `None` if the
+                 `policy` has a time budget.
         delay: The time in seconds to wait between retry attempts if an
-               `catch_exceptions` is caught. If `None`, no delay.
+               `catch_exceptions` is caught. If `None`, no delay. Ignored if a
+               `policy` is given.
         catch_exceptions: A single exception type or a tuple of exception types
                           to catch and trigger a retry. If `None`, no specific
                           exceptions are caught for retry (any `Exception` not
@@ -68,12 +206,16 @@ async def await_with_retry[T](
                         `awaitable` function will be used.
         log_prefix: A string prefix to add to all log messages generated by
                     this function, useful for identifying logs from specific calls.
+        policy: An optional `RetryPolicy` with exponential backoff, a time budget
+                and the action (retry, recover or give up) to take for each
+                caught exception type.
 
     Returns:
         The result of the `awaitable` if it succeeds within the retry limits.
 
     Raises:
-        GiveUpError: If all `retries` attempts fail due to `catch_exceptions`.
+        GiveUpError: If all `retries` attempts fail due to `catch_exceptions`,
+                     the time budget is exhausted or the policy says so.
                      The `GiveUpError` will contain a list of all exceptions
                      caught during the failed attempts.
         Exception: Any exception raised by `awaitable` that is *not* included
@@ -86,12 +228,22 @@ async def await_with_retry[T](
     elif not isinstance(catch_exceptions, tuple):
         catch_exceptions = (catch_exceptions,)
 
+    if retries is None and (policy is None or policy.budget is None):
+        msg = "retries can't be None without a time budget"
+        raise ValueError(msg)
+
     operation_name = operation_name or awaitable.__name__
     log_prefix = log_prefix or ""
     errors = []
-
-    for attempt in range(retries):
-        step = f"{attempt + 1}/{retries}"
+    deadline = (
+        time.monotonic() + policy.budget
+        if policy is not None and policy.budget is not None
+        else None
+    )
+
+    attempt = 0
+    while True:
+        step = f"{attempt + 1}/{'-' if retries is None else retries}"
         LOGGER.debug(f"{log_prefix}Running {operation_name} (attempt {step})")
 
         try:
@@ -108,33 +260,41 @@ async def await_with_retry[T](
                 f"{log_prefix}{operation_name} attempt {step}: failed with {e!r}"
             )
 
-            # If not the last attempt, sleep and recover
-            if attempt + 1 < retries:
-                if delay:
-                    await asyncio.sleep(delay)
-
-                if recover:
-                    LOGGER.debug(
-                        f"{log_prefix}{operation_name}: running recovery"
-                        f" {recover.__name__}"
-                    )
-                    try:
-                        await recover()
-                        LOGGER.debug(
-                            f"{log_prefix}{operation_name}: recovery successful"
-                        )
-                    except GiveUpError:
-                        raise
-                    except Exception as recovery_error:
-                        if not isinstance(recovery_error, catch_exceptions):
-                            raise
-                        LOGGER.warning(
-                            f"{log_prefix}{operation_name}: recovery failed with"
-                            f" {recovery_error!r}; will retry."
-                        )
+            action = policy.get_action(e) if policy else RetryAction.RECOVER
+            wait = policy.get_delay(attempt) if policy else delay
+
+        attempt += 1
+
+        # Check if there is room for another attempt
+        if action is RetryAction.GIVE_UP or (
+            retries is not None and attempt >= retries
+        ):
+            break
+        if deadline is not None and time.monotonic() + (wait or 0) >= deadline:
+            break
+
+        if wait:
+            await asyncio.sleep(wait)
+
+        if recover and action is RetryAction.RECOVER:
+            LOGGER.debug(
+                f"{log_prefix}{operation_name}: running recovery {recover.__name__}"
+            )
+            try:
+                await recover()
+                LOGGER.debug(f"{log_prefix}{operation_name}: recovery successful")
+            except GiveUpError:
+                raise
+            except Exception as recovery_error:
+                if not isinstance(recovery_error, catch_exceptions):
+                    raise
+                LOGGER.warning(
+                    f"{log_prefix}{operation_name}: recovery failed with"
+                    f" {recovery_error!r}; will retry."
+                )
 
     # All attempts exhausted
-    LOGGER.error(f"{log_prefix}Giving up after {retries} attempts.")
+    LOGGER.error(f"{log_prefix}Giving up after {attempt} attempts.")
     raise GiveUpError(errors) from errors[-1]
 
 
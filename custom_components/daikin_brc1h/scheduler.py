@@ -0,0 +1,251 @@
+"""Bluetooth adapter aware scheduler for daikin_brc1h."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import random
+import time
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from homeassistant.components import bluetooth
+
+from .const import (
+    ADAPTER_OUTAGE_MIN_UNITS,
+    ADAPTER_OUTAGE_PAUSE,
+    ADAPTER_OUTAGE_PAUSE_MAX,
+    ADAPTER_OUTAGE_RATIO,
+    ADAPTER_OUTAGE_WINDOW,
+    DEFAULT_ADAPTER_CONCURRENCY,
+    POLL_JITTER,
+    UNIT_TIME_SLICE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+LOGGER = getLogger(__name__)
+
+DEFAULT_SOURCE = "default"
+
+
+def hass_get_unit_source(hass: HomeAssistant, address: str) -> str:
+    """Get the Bluetooth adapter or proxy currently serving a unit."""
+    service_info = bluetooth.async_last_service_info(hass, address, connectable=True)
+    if service_info is None:
+        return DEFAULT_SOURCE
+
+    return service_info.source
+
+
+class UnitScheduler:
+    """
+    Schedule access to units grouped by the Bluetooth adapter serving them.
+
+    Every adapter (local dongle or proxy) gets its own semaphore, so units
+    behind different adapters run in parallel while units sharing an adapter
+    are limited to `concurrency` simultaneous operations. Each operation runs
+    inside a bounded time slice so a failing unit cannot starve the rest of
+    the units on its adapter.
+
+    Adapter-wide outages (i.e. an adapter or proxy restarting) are detected
+    from units that were polled fine and start failing, units already failing
+    (out of range, backing off...) say nothing about their adapter. Polling on
+    that adapter is paused and then a single unit, one that was healthy before
+    the outage, probes it. The rest of the units resume once the probe
+    succeeds (see `is_paused`).
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = DEFAULT_ADAPTER_CONCURRENCY,
+        time_slice: float = UNIT_TIME_SLICE,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.concurrency = concurrency
+        self.time_slice = time_slice
+        self._sources: dict[str, str] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        # Units whose last poll succeeded
+        self._healthy: set[str] = set()
+        # Per adapter: when each of its healthy units started failing
+        self._failures: dict[str, dict[str, float]] = {}
+        # Per adapter in outage: end of the pause, its length, current probe
+        # and units allowed to probe it
+        self._paused_until: dict[str, float] = {}
+        self._pause: dict[str, float] = {}
+        self._probes: dict[str, tuple[str, float]] = {}
+        self._probe_candidates: dict[str, set[str]] = {}
+
+    def register(self, address: str, source: str) -> None:
+        """Register (or move) a unit to the adapter serving it."""
+        prev = self._sources.get(address)
+        if prev != source:
+            LOGGER.debug(f"{address}: scheduled on adapter '{source}' (was '{prev}')")
+        self._sources[address] = source
+
+    def unregister(self, address: str) -> None:
+        """Forget about a unit."""
+        self._sources.pop(address, None)
+        self._healthy.discard(address)
+
+    def source_for(self, address: str) -> str:
+        """Get the adapter assigned to a unit."""
+        return self._sources.get(address, DEFAULT_SOURCE)
+
+    def load(self, source: str) -> int:
+        """Get the number of units assigned to an adapter."""
+        return sum(1 for src in self._sources.values() if src == source)
+
+    def record_failure(self, address: str) -> None:
+        """Record a failed poll, pausing the adapter if many units fail."""
+        source = self.source_for(address)
+        now = time.monotonic()
+        was_healthy = address in self._healthy
+        self._healthy.discard(address)
+
+        probe = self._probes.get(source)
+        if probe is not None and probe[0] == address:
+            LOGGER.warning(f"adapter '{source}': still failing, pausing polling")
+            self._pause_source(source, self._pause[source] * 2)
+            return
+
+        if not was_healthy:
+            return
+
+        failures = self._failures.setdefault(source, {})
+        failures[address] = now
+        for addr, failed_at in list(failures.items()):
+            if now - failed_at > ADAPTER_OUTAGE_WINDOW:
+                del failures[addr]
+
+        if source in self._paused_until:
+            return
+
+        threshold = max(
+            ADAPTER_OUTAGE_MIN_UNITS,
+            math.ceil(self.load(source) * ADAPTER_OUTAGE_RATIO),
+        )
+        if len(failures) >= threshold:
+            LOGGER.warning(
+                f"adapter '{source}': {len(failures)} units failing, pausing polling"
+            )
+            self._probe_candidates[source] = set(failures) | {
+                addr for addr in self._healthy if self._sources.get(addr) == source
+            }
+            self._pause_source(source, ADAPTER_OUTAGE_PAUSE)
+
+    def record_success(self, address: str) -> None:
+        """Record a successful poll, ending the adapter outage if it was a probe."""
+        source = self.source_for(address)
+        self._healthy.add(address)
+        self._failures.get(source, {}).pop(address, None)
+
+        probe = self._probes.get(source)
+        if probe is not None and probe[0] == address:
+            LOGGER.info(f"adapter '{source}': recovered, resuming polling")
+            del self._paused_until[source]
+            del self._pause[source]
+            del self._probes[source]
+            del self._probe_candidates[source]
+
+    def is_paused(self, address: str) -> bool:
+        """
+        Check if a unit must not be polled due to an outage of its adapter.
+
+        Once the pause is over, the first unit asking that was healthy before
+        the outage becomes the probe. It's the only one polled until it reports
+        a success (the outage is over) or a failure (the adapter is paused
+        again, for twice as long). Probes not reporting back within a time
+        slice are replaced.
+        """
+        source = self.source_for(address)
+        if source not in self._paused_until:
+            return False
+
+        now = time.monotonic()
+        if now < self._paused_until[source]:
+            return True
+
+        probe = self._probes.get(source)
+        if (
+            probe is None
+            or (probe[0] != address and now - probe[1] > 2 * self.time_slice)
+        ) and self._can_probe(source, address):
+            LOGGER.debug(f"adapter '{source}': probing with {address}")
+            probe = self._probes[source] = (address, now)
+
+        return probe is None or probe[0] != address
+
+    def _can_probe(self, source: str, address: str) -> bool:
+        # Any unit can probe if none of the healthy ones is left
+        candidates = self._probe_candidates.get(source, set()) & self._sources.keys()
+        return not candidates or address in candidates
+
+    def _pause_source(self, source: str, pause: float) -> None:
+        pause = min(pause, ADAPTER_OUTAGE_PAUSE_MAX)
+        self._pause[source] = pause
+        self._paused_until[source] = time.monotonic() + pause
+        self._probes.pop(source, None)
+        self._failures.pop(source, None)
+
+    def slot_offset(self, address: str, interval: float) -> float:
+        """
+        Get the deterministic phase offset of a unit within the poll interval.
+
+        Units are sorted by address and spread evenly across the interval, so
+        N units get N slots of `interval / N` seconds each.
+        """
+        addresses = sorted(self._sources)
+        if address not in addresses:
+            return 0.0
+
+        return interval * addresses.index(address) / len(addresses)
+
+    def next_poll_delay(self, address: str, interval: float) -> float:
+        """
+        Get the delay (in seconds) until the next poll slot of a unit.
+
+        Slots are aligned to the wall clock, so every coordinator shares the same
+        phase reference, and they are jittered by up to `POLL_JITTER` of the
+        slot width to avoid lockstep with other radios. The delay is always at
+        least half an interval to avoid polling twice in a row.
+        """
+        n = max(len(self._sources), 1)
+        jitter = random.uniform(-POLL_JITTER, POLL_JITTER) * interval / n  # noqa: S311
+        offset = self.slot_offset(address, interval) + jitter
+
+        delay = (offset - time.time()) % interval
+        if delay < interval / 2:
+            delay += interval
+
+        return delay
+
+    def _get_semaphore(self, source: str) -> asyncio.Semaphore:
+        if source not in self._semaphores:
+            self._semaphores[source] = asyncio.Semaphore(self.concurrency)
+
+        return self._semaphores[source]
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, address: str, *, time_slice: float | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Run a block of operations against a unit.
+
+        The block waits for a free slot on the adapter serving the unit and it
+        is cancelled with a `TimeoutError` if it takes longer than the time
+        slice.
+        """
+        source = self.source_for(address)
+        async with (
+            self._get_semaphore(source),
+            asyncio.timeout(time_slice or self.time_slice),
+        ):
+            yield
@@ -0,0 +1,238 @@
+"""Sensor platform for daikin_brc1h."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+
+from .const import CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+from .entity import IntegrationKadomaEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
+
+    from .coordinator import KadomaDataUpdateCoordinator
+    from .data import IntegrationKadomaConfigEntry
+
+
+@dataclass(frozen=True, kw_only=True)
+class KadomaSensorEntityDescription(SensorEntityDescription):
+    """Describes a daikin_brc1h sensor."""
+
+    value_fn: Callable[[KadomaDataUpdateCoordinator], StateType]
+    # Diagnostic sensors are updated even if the unit is not available
+    always_available: bool = False
+    # Changes below CONF_TEMPERATURE_DEADBAND are not written
+    deadband: bool = False
+
+
+def get_sensor_value(coordinator: KadomaDataUpdateCoordinator, key: str) -> StateType:
+    """Get a value of the `sensors` knob."""
+    if coordinator.state is None or coordinator.state.sensors is None:
+        return None
+
+    return coordinator.state.sensors.get(key)
+
+
+# Values of the `sensors` knob, read on every poll (no extra queries)
+SENSOR_ENTITY_DESCRIPTIONS = (
+    KadomaSensorEntityDescription(
+        key="indoor_temperature",
+        name="Indoor temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
+        value_fn=lambda coordinator: get_sensor_value(
+            coordinator, "indoor_temperature"
+        ),
+    ),
+    KadomaSensorEntityDescription(
+        key="outdoor_temperature",
+        name="Outdoor temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=True,
+        value_fn=lambda coordinator: get_sensor_value(
+            coordinator, "outdoor_temperature"
+        ),
+    ),
+)
+
+
+DIAGNOSTIC_ENTITY_DESCRIPTIONS = (
+    KadomaSensorEntityDescription(
+        key="poll_duration",
+        name="Poll duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        always_available=True,
+        value_fn=lambda coordinator: coordinator.stats.poll_duration.last,
+    ),
+    KadomaSensorEntityDescription(
+        key="lock_wait",
+        name="Scheduler wait",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        always_available=True,
+        value_fn=lambda coordinator: coordinator.stats.lock_wait.last,
+    ),
+    KadomaSensorEntityDescription(
+        key="retries",
+        name="Retries",
+        icon="mdi:repeat",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        always_available=True,
+        value_fn=lambda coordinator: coordinator.stats.retries.last,
+    ),
+    KadomaSensorEntityDescription(
+        key="recoveries",
+        name="Recoveries",
+        icon="mdi:restart",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        always_available=True,
+        value_fn=lambda coordinator: coordinator.stats.recoveries.last,
+    ),
+    KadomaSensorEntityDescription(
+        key="connection_uptime",
+        name="Connection uptime",
+        icon="mdi:bluetooth-connect",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        always_available=True,
+        value_fn=lambda coordinator: coordinator.connection.uptime,
+    ),
+    KadomaSensorEntityDescription(
+        key="rssi",
+        name="Signal strength",
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        always_available=True,
+        value_fn=lambda coordinator: coordinator.rssi,
+    ),
+)
+
+ENTITY_DESCRIPTIONS = SENSOR_ENTITY_DESCRIPTIONS + DIAGNOSTIC_ENTITY_DESCRIPTIONS
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: IntegrationKadomaConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensor platform."""
+    async_add_entities(
+        IntegrationKadomaSensor(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in ENTITY_DESCRIPTIONS
+    )
+
+
+class IntegrationKadomaSensor(IntegrationKadomaEntity, SensorEntity):
+    """daikin_brc1h sensor class."""
+
+    entity_description: KadomaSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: KadomaDataUpdateCoordinator,
+        entity_description: KadomaSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+
+        self.entity_description = entity_description
+
+        self._attr_has_entity_name = True
+        self._attr_unique_id = (
+            f"{coordinator.connection.address}_{entity_description.key}"
+        )
+
+        self._deadband = (
+            coordinator.config_entry.options.get(
+                CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+            )
+            if entity_description.deadband
+            else 0
+        )
+        self._last_value: StateType = None
+        self._last_available: bool | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Also update diagnostic sensors after polls that didn't change data."""
+        await super().async_added_to_hass()
+        if self.entity_description.always_available:
+            self.async_on_remove(
+                self.coordinator.async_add_poll_listener(self.async_write_ha_state)
+            )
+
+    @property
+    def available(self) -> bool:
+        if self.entity_description.always_available:
+            return True
+
+        return super().available and self.coordinator.data is not None
+
+    @property
+    def native_value(self) -> StateType:
+        return self.entity_description.value_fn(self.coordinator)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, unless the change is within the deadband."""
+        available = self.available
+        value = self.native_value if available else None
+
+        if (
+            self._deadband
+            and available == self._last_available
+            and isinstance(value, (int, float))
+            and isinstance(self._last_value, (int, float))
+            and abs(value - self._last_value) < self._deadband
+        ):
+            return
+
+        self._last_available = available
+        self._last_value = value
+        super()._handle_coordinator_update()
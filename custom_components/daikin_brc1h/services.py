@@ -0,0 +1,140 @@
+"""Services for daikin_brc1h."""
+
+from __future__ import annotations
+
+import asyncio
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+import bleak.exc
+import voluptuous as vol
+from homeassistant.components.climate import ATTR_FAN_MODE, ATTR_HVAC_MODE, HVACMode
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+from .commands import get_command_values
+from .connection import UnitDisconnectedError
+from .const import DOMAIN, MAX_TEMP, MIN_TEMP
+from .state import FAN_MODE_TO_FAN_SPEED
+
+if TYPE_CHECKING:
+    from .data import IntegrationKadomaConfigEntry
+
+LOGGER = getLogger(__name__)
+
+SERVICE_CONTROL_UNITS = "control_units"
+
+CONTROL_UNITS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Optional(ATTR_HVAC_MODE): vol.Coerce(HVACMode),
+            vol.Optional(ATTR_TEMPERATURE): vol.All(
+                vol.Coerce(float), vol.Range(min=MIN_TEMP, max=MAX_TEMP)
+            ),
+            vol.Optional(ATTR_FAN_MODE): vol.In(list(FAN_MODE_TO_FAN_SPEED)),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_HVAC_MODE, ATTR_TEMPERATURE, ATTR_FAN_MODE),
+)
+
+
+def hass_get_unit_entry(
+    hass: HomeAssistant, entity_id: str
+) -> IntegrationKadomaConfigEntry | None:
+    """Get the loaded config entry of a unit from any of its entities."""
+    entity = er.async_get(hass).async_get(entity_id)
+    if entity is None or entity.platform != DOMAIN or entity.config_entry_id is None:
+        return None
+
+    entry = hass.config_entries.async_get_entry(entity.config_entry_id)
+    if entry is None or entry.state is not ConfigEntryState.LOADED:
+        return None
+
+    return entry
+
+
+async def async_control_units(call: ServiceCall) -> ServiceResponse:
+    """
+    Apply the same climate settings to several units at once.
+
+    Units are written in parallel and share the scheduler slots (and its
+    concurrency) with polling. The optimistic state of every unit is applied
+    as the writes are dispatched, before waiting for any of them, and the
+    result of each entity is returned (entities of the same unit share it).
+    """
+    hass = call.hass
+    settings = {
+        "hvac_mode": call.data.get(ATTR_HVAC_MODE),
+        "temperature": call.data.get(ATTR_TEMPERATURE),
+        "fan_mode": call.data.get(ATTR_FAN_MODE),
+    }
+
+    results: dict[str, dict[str, Any]] = {}
+    units: dict[str, tuple[IntegrationKadomaConfigEntry, list[str]]] = {}
+
+    for entity_id in call.data[ATTR_ENTITY_ID]:
+        entry = hass_get_unit_entry(hass, entity_id)
+        if entry is None:
+            results[entity_id] = {"success": False, "error": "unknown or not loaded"}
+            continue
+
+        # Several entities of the same unit are controlled once
+        units.setdefault(entry.entry_id, (entry, []))[1].append(entity_id)
+
+    async def control_unit(entry: IntegrationKadomaConfigEntry) -> dict[str, Any]:
+        address = entry.runtime_data.connection.address
+        try:
+            values = get_command_values(
+                entry.runtime_data.coordinator.state, **settings
+            )
+            await entry.runtime_data.commands.async_write(**values)
+
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+        except (TimeoutError, bleak.exc.BleakError, UnitDisconnectedError) as e:
+            LOGGER.warning(f"{address}: unable to write to unit ({e!r})")
+            return {"success": False, "error": repr(e)}
+
+        return {"success": True, "error": None}
+
+    LOGGER.debug(f"controlling {len(units)} units")
+    unit_results = await asyncio.gather(
+        *(control_unit(entry) for entry, _ in units.values()),
+        return_exceptions=True,
+    )
+
+    # A failed unit doesn't fail the others
+    for (entry, entity_ids), result in zip(units.values(), unit_results, strict=True):
+        if isinstance(result, BaseException):
+            LOGGER.error(
+                f"{entry.runtime_data.connection.address}: unexpected error"
+                f" writing to unit ({result!r})",
+                exc_info=result,
+            )
+            result = {"success": False, "error": repr(result)}  # noqa: PLW2901
+
+        for entity_id in entity_ids:
+            results[entity_id] = result
+
+    return {"units": results}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CONTROL_UNITS,
+        async_control_units,
+        schema=CONTROL_UNITS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
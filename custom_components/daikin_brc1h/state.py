@@ -0,0 +1,151 @@
+"""Unit state snapshots for daikin_brc1h."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any
+
+import kadoma
+from homeassistant.components.climate import HVACMode
+
+LOGGER = getLogger(__name__)
+
+OPERATION_MODE_TO_HVAC_MODE: dict[kadoma.OperationModeValue, HVACMode] = {
+    kadoma.OperationModeValue.AUTO: HVACMode.AUTO,
+    kadoma.OperationModeValue.COOL: HVACMode.COOL,
+    kadoma.OperationModeValue.DRY: HVACMode.DRY,
+    kadoma.OperationModeValue.FAN: HVACMode.FAN_ONLY,
+    kadoma.OperationModeValue.HEAT: HVACMode.HEAT,
+}
+HVAC_MODE_TO_OPERATION_MODE: dict[HVACMode, kadoma.OperationModeValue] = {
+    v: k for k, v in OPERATION_MODE_TO_HVAC_MODE.items()
+}
+
+FAN_SPEED_TO_FAN_MODE: dict[kadoma.FanSpeedValue, str] = {
+    kadoma.FanSpeedValue.AUTO: "auto",
+    kadoma.FanSpeedValue.LOW: "low",
+    kadoma.FanSpeedValue.MID_LOW: "medium_low",
+    kadoma.FanSpeedValue.MID: "medium",
+    kadoma.FanSpeedValue.MID_HIGH: "medium_high",
+    kadoma.FanSpeedValue.HIGH: "high",
+}
+FAN_MODE_TO_FAN_SPEED: dict[str, kadoma.FanSpeedValue] = {
+    v: k for k, v in FAN_SPEED_TO_FAN_MODE.items()
+}
+
+
+def get_hvac_mode(
+    power_state: bool | None,  # noqa: FBT001
+    operation_mode: kadoma.OperationModeValue | None,
+) -> HVACMode | None:
+    """Get the HA HVAC mode of the unit."""
+    if power_state is False:
+        return HVACMode.OFF
+
+    if operation_mode not in OPERATION_MODE_TO_HVAC_MODE:
+        LOGGER.debug(f"unsupported operation mode '{operation_mode}'")
+        return None
+
+    return OPERATION_MODE_TO_HVAC_MODE[operation_mode]
+
+
+def get_fan_mode(
+    operation_mode: kadoma.OperationModeValue | None,
+    fan_speed: tuple[kadoma.FanSpeedValue, kadoma.FanSpeedValue] | None,
+) -> str | None:
+    """
+    Get the HA fan mode of the unit.
+
+    The unit has different fan speeds for cooling and heating, the one for the
+    current operation mode is used. Other modes use the cooling fan speed, it
+    may be incorrect if both of them don't match.
+    """
+    if fan_speed is None:
+        return None
+
+    cooling_fan_speed, heating_fan_speed = fan_speed
+    if operation_mode is kadoma.OperationModeValue.HEAT:
+        value = heating_fan_speed
+    else:
+        value = cooling_fan_speed
+
+    if value not in FAN_SPEED_TO_FAN_MODE:
+        LOGGER.debug(f"unsupported fan speed '{value}'")
+        return None
+
+    return FAN_SPEED_TO_FAN_MODE[value]
+
+
+def get_target_temperature(
+    operation_mode: kadoma.OperationModeValue | None,
+    set_point: dict[str, int] | None,
+) -> float | None:
+    """
+    Get the HA target temperature of the unit.
+
+    The unit has different set points for cooling and heating, the one for the
+    current operation mode is used. FAN mode has no target temperature and
+    other modes (i.e. AUTO) use the mean of both set points.
+    """
+    if set_point is None or operation_mode is kadoma.OperationModeValue.FAN:
+        return None
+
+    cooling = set_point.get("cooling_set_point")
+    heating = set_point.get("heating_set_point")
+
+    if operation_mode is kadoma.OperationModeValue.HEAT:
+        return heating
+
+    if operation_mode is kadoma.OperationModeValue.COOL:
+        return cooling
+
+    if cooling is None or heating is None:
+        return None
+
+    return round((heating + cooling) / 2)
+
+
+@dataclass(frozen=True, slots=True)
+class UnitState:
+    """
+    Snapshot of the unit state.
+
+    Built once for each coordinator update with the raw knob values and the
+    values derived from them for Home Assistant, so entities only read
+    attributes when their state is written.
+    """
+
+    power_state: bool | None
+    operation_mode: kadoma.OperationModeValue | None
+    fan_speed: tuple[kadoma.FanSpeedValue, kadoma.FanSpeedValue] | None
+    set_point: dict[str, int] | None
+    sensors: dict[str, Any] | None
+    clean_filter_indicator: bool | None
+
+    hvac_mode: HVACMode | None
+    fan_mode: str | None
+    target_temperature: float | None
+    current_temperature: float | None
+
+    @classmethod
+    def from_values(cls, values: dict[str, Any]) -> UnitState:
+        """Build a snapshot from knob values, as stored in coordinator data."""
+        power_state = values.get("power_state")
+        operation_mode = values.get("operation_mode")
+        fan_speed = values.get("fan_speed")
+        set_point = values.get("set_point")
+        sensors = values.get("sensors")
+
+        return cls(
+            power_state=power_state,
+            operation_mode=operation_mode,
+            fan_speed=fan_speed,
+            set_point=set_point,
+            sensors=sensors,
+            clean_filter_indicator=values.get("clean_filter_indicator"),
+            hvac_mode=get_hvac_mode(power_state, operation_mode),
+            fan_mode=get_fan_mode(operation_mode, fan_speed),
+            target_temperature=get_target_temperature(operation_mode, set_point),
+            current_temperature=(sensors or {}).get("indoor_temperature"),
+        )
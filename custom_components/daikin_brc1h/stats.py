@@ -0,0 +1,75 @@
+"""Performance statistics for daikin_brc1h."""
+
+from __future__ import annotations
+
+import statistics
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import STATS_BUFFER_SIZE
+
+
+class RollingStats:
+    """Rolling histogram of the last samples, kept in a fixed-size ring buffer."""
+
+    def __init__(self, size: int = STATS_BUFFER_SIZE) -> None:
+        """Initialize the buffer."""
+        self.samples: deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest one if the buffer is full."""
+        self.samples.append(value)
+
+    @property
+    def last(self) -> float | None:
+        """Get the last sample."""
+        return self.samples[-1] if self.samples else None
+
+    def percentile(self, pct: int) -> float | None:
+        """Get a percentile (1-99) of the samples."""
+        if not self.samples:
+            return None
+
+        if len(self.samples) == 1:
+            return self.samples[0]
+
+        return statistics.quantiles(self.samples, n=100, method="inclusive")[pct - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize the samples."""
+        return {
+            "count": len(self.samples),
+            "last": self.last,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": max(self.samples, default=None),
+        }
+
+
+@dataclass
+class UnitStats:
+    """Timing and error statistics of a unit."""
+
+    poll_duration: RollingStats = field(default_factory=RollingStats)
+    lock_wait: RollingStats = field(default_factory=RollingStats)
+    retries: RollingStats = field(default_factory=RollingStats)
+    recoveries: RollingStats = field(default_factory=RollingStats)
+    knob_latency: defaultdict[str, RollingStats] = field(
+        default_factory=lambda: defaultdict(RollingStats)
+    )
+    polls: int = 0
+    failed_polls: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize all the statistics."""
+        return {
+            "polls": self.polls,
+            "failed_polls": self.failed_polls,
+            "poll_duration": self.poll_duration.as_dict(),
+            "lock_wait": self.lock_wait.as_dict(),
+            "retries": self.retries.as_dict(),
+            "recoveries": self.recoveries.as_dict(),
+            "knob_latency": {k: v.as_dict() for k, v in self.knob_latency.items()},
+        }
@@ -0,0 +1,186 @@
+"""Persistence of the last known unit state for daikin_brc1h."""
+
+from __future__ import annotations
+
+import enum
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+import kadoma
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import (
+    DOMAIN,
+    STATE_RESTORE_MAX_AGE,
+    STATE_SAVE_DELAY,
+    STATE_STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+LOGGER = getLogger(__name__)
+
+ENUM_KEY = "__enum__"
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Encode a knob value as JSON.
+
+    kadoma enums are stored by class and member name, tuples (i.e. fan speeds)
+    are stored as lists.
+    """
+    if isinstance(value, enum.Enum):
+        return {ENUM_KEY: type(value).__name__, "name": value.name}
+
+    if isinstance(value, dict):
+        return {k: encode_value(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    """
+    Decode a knob value encoded with `encode_value`.
+
+    Raises:
+        ValueError: If the value references an unknown kadoma enum or member.
+
+    """
+    if isinstance(value, dict) and ENUM_KEY in value:
+        enum_cls = getattr(kadoma, value[ENUM_KEY], None)
+        if not isinstance(enum_cls, enum.EnumMeta):
+            msg = f"unknown enum '{value[ENUM_KEY]}'"
+            raise ValueError(msg)
+
+        try:
+            return enum_cls[value["name"]]
+        except KeyError as e:
+            msg = f"unknown member '{value['name']}' of '{value[ENUM_KEY]}'"
+            raise ValueError(msg) from e
+
+    if isinstance(value, dict):
+        return {k: decode_value(v) for k, v in value.items()}
+
+    if isinstance(value, list):
+        return tuple(decode_value(v) for v in value)
+
+    return value
+
+
+class UnitStateStore:
+    """
+    Last known state of a unit, persisted across restarts.
+
+    Saves are delayed (see `STATE_SAVE_DELAY`) so a burst of updates results
+    in a single write, pending saves are flushed by Home Assistant on
+    shutdown.
+    """
+
+    def __init__(self, hass: HomeAssistant, address: str) -> None:
+        """Initialize the store."""
+        self.address = address
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STATE_STORAGE_VERSION, f"{DOMAIN}.{slugify(address)}"
+        )
+        self._data: dict[str, Any] = {}
+        # Calibrated delay between commands (see `AdaptiveDelay`), if known
+        self.delay: float | None = None
+
+    async def async_load(
+        self,
+    ) -> tuple[dict[str, Any], dict[str, datetime]] | None:
+        """
+        Load the last known state.
+
+        Returns:
+            The knob values and when each of them was received, or `None` if
+            there is no usable state. Knobs that can't be decoded are skipped.
+
+        """
+        self._data = await self._store.async_load() or {}
+        self.delay = self._data.get("delay")
+        if not self._data.get("values"):
+            return None
+
+        saved_at = dt_util.parse_datetime(self._data.get("saved_at") or "")
+        if saved_at is None or dt_util.utcnow() - saved_at > STATE_RESTORE_MAX_AGE:
+            LOGGER.debug(f"{self.address}: persisted state is too old, ignoring it")
+            return None
+
+        values = {}
+        updated_at = {}
+        for k, v in self._data["values"].items():
+            try:
+                values[k] = decode_value(v)
+            except ValueError as e:
+                LOGGER.debug(f"{self.address}: unable to restore '{k}' ({e})")
+                continue
+
+            updated_at[k] = (
+                dt_util.parse_datetime(self._data.get("updated_at", {}).get(k, ""))
+                or saved_at
+            )
+
+        return values, updated_at
+
+    def async_schedule_save(
+        self,
+        get_state: Callable[[], tuple[dict[str, Any], dict[str, datetime]]],
+        get_delay: Callable[[], float],
+    ) -> None:
+        """
+        Save the state, after `STATE_SAVE_DELAY` seconds.
+
+        Args:
+            get_state: A callable returning the knob values and when each of
+                       them was received, called when the state is written.
+            get_delay: A callable returning the calibrated delay between
+                       commands.
+
+        """
+        self._store.async_delay_save(
+            lambda: self._get_data_to_save(*get_state(), get_delay()),
+            STATE_SAVE_DELAY,
+        )
+
+    async def async_save(
+        self, values: dict[str, Any], updated_at: dict[str, datetime], delay: float
+    ) -> None:
+        """
+        Save the state now, replacing any scheduled save.
+
+        Used on unload, so a delayed save doesn't outlive the entry (i.e.
+        writing the file again after it's removed).
+        """
+        await self._store.async_save(self._get_data_to_save(values, updated_at, delay))
+
+    def _get_data_to_save(
+        self, values: dict[str, Any], updated_at: dict[str, datetime], delay: float
+    ) -> dict[str, Any]:
+        self._data["delay"] = delay
+        # Keep the last known state if the unit is not available
+        if values:
+            self._data = {
+                **self._data,
+                "saved_at": dt_util.utcnow().isoformat(),
+                "values": {
+                    k: encode_value(v) for k, v in values.items() if v is not None
+                },
+                "updated_at": {k: v.isoformat() for k, v in updated_at.items()},
+            }
+
+        return self._data
+
+    async def async_remove(self) -> None:
+        """Remove the persisted state."""
+        await self._store.async_remove()